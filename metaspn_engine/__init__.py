@@ -27,7 +27,7 @@ Usage:
 
 from .core import Signal, Emission, State
 from .pipeline import Pipeline, Step, Predicate
-from .engine import Engine
+from .engine import Engine, AsyncEngine
 from .transforms import (
     map_signal,
     filter_signal,
@@ -35,6 +35,7 @@ from .transforms import (
     window,
     emit,
     emit_if,
+    emit_many,
     branch,
     merge,
 )
@@ -47,6 +48,8 @@ from .m4_rewards import (
     M4RewardState,
     build_m4_reward_pipeline,
     make_m4_signal,
+    build_m4_batch_reward_pipeline,
+    make_m4_batch_signal,
 )
 
 __version__ = "0.1.3"
@@ -61,6 +64,7 @@ __all__ = [
     "Predicate",
     # Engine
     "Engine",
+    "AsyncEngine",
     # Transforms
     "map_signal",
     "filter_signal",
@@ -68,6 +72,7 @@ __all__ = [
     "window",
     "emit",
     "emit_if",
+    "emit_many",
     "branch",
     "merge",
     # Protocols
@@ -82,4 +87,6 @@ __all__ = [
     "M4RewardState",
     "build_m4_reward_pipeline",
     "make_m4_signal",
+    "build_m4_batch_reward_pipeline",
+    "make_m4_batch_signal",
 ]
@@ -22,8 +22,14 @@ U = TypeVar("U")  # Emission payload type
 S = TypeVar("S")  # State type
 
 
-@dataclass(frozen=True)
-class Signal(Generic[T]):
+class _DictCache:
+    """Holds the lazily built scalar ``to_dict`` envelope outside the dataclass fields."""
+    # __weakref__ keeps slotted signals and emissions weak-referenceable.
+    __slots__ = ("_cached_envelope", "__weakref__")
+
+
+@dataclass(frozen=True, slots=True)
+class Signal(_DictCache, Generic[T]):
     """
     An immutable input event to the engine.
     
@@ -64,21 +70,31 @@ class Signal(Generic[T]):
         )
     
     def to_dict(self) -> Dict[str, Any]:
-        """Serialize to dictionary."""
-        return {
-            "signal_id": self.signal_id,
-            "timestamp": self.timestamp.isoformat(),
-            "source": self.source,
-            "payload": self._serialize_payload(),
-            "metadata": self.metadata,
-        }
+        """
+        Serialize to dictionary.
+        
+        The scalar envelope is built once per signal; the payload may be
+        mutable, so it is serialized fresh on every call.
+        """
+        envelope = getattr(self, "_cached_envelope", None)
+        if envelope is None:
+            envelope = {
+                "signal_id": self.signal_id,
+                "timestamp": self.timestamp.isoformat(),
+                "source": self.source,
+            }
+            object.__setattr__(self, "_cached_envelope", envelope)
+        return {**envelope, "payload": self._serialize_payload(), "metadata": self.metadata}
     
     def _serialize_payload(self) -> Any:
         """Serialize payload - override for custom types."""
         if hasattr(self.payload, "to_dict"):
             return self.payload.to_dict()
+        # Check dataclasses first: slotted dataclasses have no __dict__.
+        if hasattr(self.payload, "__dataclass_fields__"):
+            return asdict(self.payload)  # type: ignore[call-overload]
         if hasattr(self.payload, "__dict__"):
-            return asdict(self.payload) if hasattr(self.payload, "__dataclass_fields__") else self.payload.__dict__  # type: ignore[call-overload]
+            return self.payload.__dict__
         return self.payload
     
     @classmethod
@@ -93,8 +109,8 @@ class Signal(Generic[T]):
         )
 
 
-@dataclass(frozen=True)
-class Emission(Generic[U]):
+@dataclass(frozen=True, slots=True)
+class Emission(_DictCache, Generic[U]):
     """
     An immutable output event from the engine.
     
@@ -105,6 +121,9 @@ class Emission(Generic[U]):
     - An emission type (for routing/filtering downstream)
     - Optional metadata
     
+    Emissions compare field by field without serializing, and hash on
+    ``(caused_by, emission_id)`` so they can be de-duplicated in sets.
+    
     Example:
         @dataclass(frozen=True)
         class ScoreUpdate(Emission[GameScore]):
@@ -123,23 +142,38 @@ class Emission(Generic[U]):
     timestamp: datetime = field(default_factory=datetime.now)
     metadata: Dict[str, Any] = field(default_factory=dict)
     
+    def __hash__(self) -> int:
+        # Payloads and metadata are usually dicts, so hash on identity fields only;
+        # equal emissions always share these.
+        return hash((self.caused_by, self.emission_id))
+    
     def to_dict(self) -> Dict[str, Any]:
-        """Serialize to dictionary."""
-        return {
-            "emission_id": self.emission_id,
-            "caused_by": self.caused_by,
-            "emission_type": self.emission_type,
-            "timestamp": self.timestamp.isoformat(),
-            "payload": self._serialize_payload(),
-            "metadata": self.metadata,
-        }
+        """
+        Serialize to dictionary.
+        
+        The scalar envelope is built once per emission; the payload may be
+        mutable, so it is serialized fresh on every call.
+        """
+        envelope = getattr(self, "_cached_envelope", None)
+        if envelope is None:
+            envelope = {
+                "emission_id": self.emission_id,
+                "caused_by": self.caused_by,
+                "emission_type": self.emission_type,
+                "timestamp": self.timestamp.isoformat(),
+            }
+            object.__setattr__(self, "_cached_envelope", envelope)
+        return {**envelope, "payload": self._serialize_payload(), "metadata": self.metadata}
     
     def _serialize_payload(self) -> Any:
         """Serialize payload - override for custom types."""
         if hasattr(self.payload, "to_dict"):
             return self.payload.to_dict()
+        # Check dataclasses first: slotted dataclasses have no __dict__.
+        if hasattr(self.payload, "__dataclass_fields__"):
+            return asdict(self.payload)  # type: ignore[call-overload]
         if hasattr(self.payload, "__dict__"):
-            return asdict(self.payload) if hasattr(self.payload, "__dataclass_fields__") else self.payload.__dict__  # type: ignore[call-overload]
+            return self.payload.__dict__
         return self.payload
 
 
@@ -194,8 +228,11 @@ class State(Generic[S]):
         """Create a snapshot of the current value."""
         if hasattr(self.value, "to_dict"):
             return self.value.to_dict()
+        # Check dataclasses first: slotted dataclasses have no __dict__.
+        if hasattr(self.value, "__dataclass_fields__"):
+            return asdict(self.value)  # type: ignore[call-overload]
         if hasattr(self.value, "__dict__"):
-            return asdict(self.value) if hasattr(self.value, "__dataclass_fields__") else dict(self.value.__dict__)  # type: ignore[call-overload]
+            return dict(self.value.__dict__)
         return self.value
     
     def get_history(self) -> list[Any]:
@@ -2,10 +2,11 @@
 
 from __future__ import annotations
 
+import sys
 from dataclasses import dataclass
 
 
-@dataclass(frozen=True)
+@dataclass(frozen=True, slots=True)
 class DemoStageSpec:
     """Reference metadata for a demo stage backed by an engine pipeline."""
 
@@ -15,45 +16,53 @@ class DemoStageSpec:
     emission_suffixes: tuple[str, ...]
 
 
+def _suffixes(*names: str) -> tuple[str, ...]:
+    return tuple(sys.intern(name) for name in names)
+
+
+# Built once at import so every lookup shares the same interned suffix strings.
+_DEMO_STAGE_SPECS = {
+    "m0_ingest": DemoStageSpec(
+        stage_key="m0_ingest",
+        pipeline_name="m0_ingest_resolve_emit",
+        module_name="metaspn_engine.m0_ingestion",
+        emission_suffixes=_suffixes("ingest", "resolve", "emit"),
+    ),
+    "m1_route": DemoStageSpec(
+        stage_key="m1_route",
+        pipeline_name="m1_profile_score_route",
+        module_name="metaspn_engine.m1_routing",
+        emission_suffixes=_suffixes("profile", "score", "route"),
+    ),
+    "m2_shortlist": DemoStageSpec(
+        stage_key="m2_shortlist",
+        pipeline_name="m2_rank_and_draft",
+        module_name="metaspn_engine.m2_recommendations",
+        emission_suffixes=_suffixes("recommendation", "draft"),
+    ),
+    "m3_learning": DemoStageSpec(
+        stage_key="m3_learning",
+        pipeline_name="m3_attempt_outcome_failure_calibration",
+        module_name="metaspn_engine.m3_learning",
+        emission_suffixes=_suffixes("attempt", "outcome", "failure", "calibration"),
+    ),
+    "m4_rewards": DemoStageSpec(
+        stage_key="m4_rewards",
+        pipeline_name="m4_attention_pool_staker",
+        module_name="metaspn_engine.m4_rewards",
+        emission_suffixes=_suffixes("attention", "pool", "staker"),
+    ),
+}
+
+
 def demo_stage_specs() -> dict[str, DemoStageSpec]:
     """Return demo stage mapping to engine reference pipelines."""
 
-    return {
-        "m0_ingest": DemoStageSpec(
-            stage_key="m0_ingest",
-            pipeline_name="m0_ingest_resolve_emit",
-            module_name="metaspn_engine.m0_ingestion",
-            emission_suffixes=("ingest", "resolve", "emit"),
-        ),
-        "m1_route": DemoStageSpec(
-            stage_key="m1_route",
-            pipeline_name="m1_profile_score_route",
-            module_name="metaspn_engine.m1_routing",
-            emission_suffixes=("profile", "score", "route"),
-        ),
-        "m2_shortlist": DemoStageSpec(
-            stage_key="m2_shortlist",
-            pipeline_name="m2_rank_and_draft",
-            module_name="metaspn_engine.m2_recommendations",
-            emission_suffixes=("recommendation", "draft"),
-        ),
-        "m3_learning": DemoStageSpec(
-            stage_key="m3_learning",
-            pipeline_name="m3_attempt_outcome_failure_calibration",
-            module_name="metaspn_engine.m3_learning",
-            emission_suffixes=("attempt", "outcome", "failure", "calibration"),
-        ),
-        "m4_rewards": DemoStageSpec(
-            stage_key="m4_rewards",
-            pipeline_name="m4_attention_pool_staker",
-            module_name="metaspn_engine.m4_rewards",
-            emission_suffixes=("attention", "pool", "staker"),
-        ),
-    }
+    return dict(_DEMO_STAGE_SPECS)
 
 
 def expected_emission_ids(signal_id: str, stage_key: str) -> list[str]:
     """Build deterministic emission IDs for a given demo stage and signal ID."""
 
-    spec = demo_stage_specs()[stage_key]
+    spec = _DEMO_STAGE_SPECS[stage_key]
     return [f"{signal_id}:{suffix}" for suffix in spec.emission_suffixes]
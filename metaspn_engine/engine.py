@@ -12,16 +12,33 @@ from __future__ import annotations
 from dataclasses import dataclass
 from datetime import datetime
 from typing import (
-    Any, Optional, List,
-    Callable, Iterator, Iterable, Tuple
+    Any, Optional, List, Union,
+    Callable, Iterator, Iterable, Tuple,
+    AsyncIterable, AsyncIterator
 )
+import asyncio
 import json
+import os
+from concurrent.futures import ThreadPoolExecutor
+from itertools import chain
 from pathlib import Path
 
 from .core import Signal, Emission, State
 from .pipeline import Pipeline
 
 
+# Default worker count for batches on stateless pipelines (1 = serial).
+BATCH_WORKERS_ENV = "METASPN_BATCH_WORKERS"
+
+
+def _batch_workers_from_env() -> int:
+    """Read the batch worker count, treating missing or malformed values as serial."""
+    try:
+        return max(int(os.environ.get(BATCH_WORKERS_ENV, "1")), 1)
+    except ValueError:
+        return 1
+
+
 @dataclass
 class EngineConfig:
     """Configuration for the engine."""
@@ -119,10 +136,11 @@ class Engine:
             List of emissions produced
         """
         # Update stats
+        now = datetime.now()
         self.stats.signals_processed += 1
-        self.stats.last_signal_at = datetime.now()
+        self.stats.last_signal_at = now
         if self.stats.started_at is None:
-            self.stats.started_at = datetime.now()
+            self.stats.started_at = now
         
         # Track signal if configured
         if self.config.track_signal_history:
@@ -173,23 +191,133 @@ class Engine:
     
     def process_batch(
         self, 
-        signals: Iterable[Signal[Any]]
+        signals: Iterable[Signal[Any]],
+        workers: Optional[int] = None,
     ) -> List[Emission[Any]]:
         """
         Process multiple signals.
         
+        When no per-signal hooks or signal history are configured, the batch
+        runs straight through the pipeline and stats, emission history and
+        state persistence are settled once for the whole batch. Batches on
+        pipelines declared ``stateful=False`` additionally fan out across
+        ``workers`` threads; emissions keep input order either way.
+        
         Args:
             signals: Iterable of signals to process
+            workers: Thread count for stateless pipelines (defaults to the
+                METASPN_BATCH_WORKERS environment variable, else 1)
             
         Returns:
             List of all emissions produced
         """
+        if self._needs_per_signal_handling():
+            return list(chain.from_iterable(map(self.process, signals)))
+        
+        if not self.pipeline.stateful:
+            if workers is None:
+                workers = _batch_workers_from_env()
+            if workers > 1:
+                return self._process_batch_concurrent(signals, workers)
+        return self._process_batch_direct(signals)
+    
+    def _needs_per_signal_handling(self) -> bool:
+        """Whether batch processing must go through process() for each signal."""
+        config = self.config
+        return (
+            config.track_signal_history
+            or config.on_signal is not None
+            or config.on_emission is not None
+            or config.on_state_change is not None
+            or config.on_error is not None
+        )
+    
+    def _process_batch_direct(self, signals: Iterable[Signal[Any]]) -> List[Emission[Any]]:
+        """Run a batch through the pipeline with bookkeeping amortized per batch."""
+        process = self.pipeline.process
+        state = self.state
+        version_before = state.version
         all_emissions: List[Emission[Any]] = []
-        for signal in signals:
-            emissions = self.process(signal)
-            all_emissions.extend(emissions)
+        signal_count = 0
+        
+        try:
+            for signal in signals:
+                emissions, state = process(signal, state)
+                all_emissions.extend(emissions)
+                signal_count += 1
+        except Exception:
+            self.stats.errors_encountered += 1
+            raise
+        finally:
+            self.state = state
+            self._record_batch(signal_count, all_emissions, version_before)
+        
         return all_emissions
     
+    def _process_batch_concurrent(
+        self,
+        signals: Iterable[Signal[Any]],
+        workers: int,
+    ) -> List[Emission[Any]]:
+        """Run a stateless batch across a thread pool, preserving input order."""
+        signal_list = list(signals)
+        state = self.state
+        version_before = state.version
+        
+        def run(signal: Signal[Any]) -> List[Emission[Any]]:
+            # Each signal gets a private wrapper so a stray updater is caught, not raced
+            scratch = State(value=state.value)
+            emissions, scratch = self.pipeline.process(signal, scratch)
+            if scratch.version:
+                raise RuntimeError(
+                    f"Pipeline {self.pipeline.name!r} is declared stateful=False "
+                    "but a step returned a state updater"
+                )
+            return emissions
+        
+        try:
+            with ThreadPoolExecutor(max_workers=workers) as executor:
+                all_emissions = list(chain.from_iterable(executor.map(run, signal_list)))
+        except Exception:
+            self.stats.errors_encountered += 1
+            raise
+        
+        self._record_batch(len(signal_list), all_emissions, version_before)
+        return all_emissions
+    
+    def _record_batch(
+        self,
+        signal_count: int,
+        emissions: List[Emission[Any]],
+        version_before: int,
+    ) -> None:
+        """Apply stats, history and persistence for a directly processed batch."""
+        if signal_count == 0:
+            return
+        
+        now = datetime.now()
+        self.stats.signals_processed += signal_count
+        self.stats.last_signal_at = now
+        if self.stats.started_at is None:
+            self.stats.started_at = now
+        
+        # Each signal bumps the version at most once, so the delta is the update count
+        state_updates = self.state.version - version_before
+        if state_updates > 0:
+            self.stats.state_updates += state_updates
+            if self.config.persist_state and self.config.state_file:
+                self._save_state()
+        
+        self.stats.emissions_produced += len(emissions)
+        if emissions:
+            self.stats.last_emission_at = now
+            if self.config.track_emission_history:
+                history = self._emission_history
+                history.extend(emissions)
+                overflow = len(history) - self.config.max_history_size
+                if overflow > 0:
+                    del history[:overflow]
+    
     def stream(
         self,
         signals: Iterator[Signal[Any]]
@@ -249,6 +377,82 @@ class Engine:
                 self.state.version = data.get("version", 0)
 
 
+_END_OF_STREAM = object()
+
+
+class AsyncEngine:
+    """
+    Asyncio front-end that overlaps signal intake with pipeline processing.
+    
+    A producer task pulls signals from a sync or async iterable into a
+    bounded queue while the consumer runs them through the wrapped Engine
+    in arrival order. Steps share state, so processing itself stays
+    serial; the queue bound stops a fast source from running ahead.
+    
+    Example:
+        async_engine = AsyncEngine(engine, max_pending=256)
+        
+        async for signal, emissions in async_engine.process_stream(source):
+            handle(signal, emissions)
+    """
+    
+    def __init__(self, engine: Engine, max_pending: Optional[int] = None):
+        """
+        Initialize the async engine.
+        
+        Args:
+            engine: The engine that processes each signal
+            max_pending: Queue bound (defaults to the engine's batch_size)
+        """
+        self.engine = engine
+        self.max_pending = max_pending or engine.config.batch_size
+    
+    async def process_stream(
+        self,
+        signals: Union[Iterable[Signal[Any]], AsyncIterable[Signal[Any]]],
+    ) -> AsyncIterator[Tuple[Signal[Any], List[Emission[Any]]]]:
+        """
+        Process signals as they arrive, yielding (signal, emissions) pairs.
+        
+        Args:
+            signals: Sync or async iterable of signals
+            
+        Yields:
+            Tuples of (signal, emissions_for_that_signal), in input order
+        """
+        queue: asyncio.Queue[Any] = asyncio.Queue(maxsize=self.max_pending)
+        
+        async def produce() -> None:
+            try:
+                if isinstance(signals, AsyncIterable):
+                    async for signal in signals:
+                        await queue.put(signal)
+                else:
+                    for signal in signals:
+                        await queue.put(signal)
+            except Exception:
+                # Wake the consumer so it can surface the source error
+                await queue.put(_END_OF_STREAM)
+                raise
+            # No sentinel on cancellation: the consumer is gone and the queue may be full
+            await queue.put(_END_OF_STREAM)
+        
+        producer = asyncio.create_task(produce())
+        try:
+            while True:
+                signal = await queue.get()
+                if signal is _END_OF_STREAM:
+                    break
+                yield signal, self.engine.process(signal)
+            # Surface any error raised by the signal source
+            await producer
+        finally:
+            if not producer.done():
+                producer.cancel()
+                # Let the cancellation land so the task and its source are released
+                await asyncio.wait([producer])
+
+
 class EngineBuilder:
     """
     Fluent builder for creating engines.
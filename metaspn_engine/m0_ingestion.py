@@ -2,14 +2,20 @@
 
 from __future__ import annotations
 
+import sys
 from dataclasses import dataclass
 from datetime import datetime
 
 from .core import Emission, Signal
 from .pipeline import Pipeline, StepResult
 
+# Stage emission-id suffixes, appended to the source signal_id.
+_INGEST_SUFFIX = sys.intern(":ingest")
+_RESOLVE_SUFFIX = sys.intern(":resolve")
+_EMIT_SUFFIX = sys.intern(":emit")
 
-@dataclass(frozen=True)
+
+@dataclass(frozen=True, slots=True)
 class SocialIngestionEvent:
     """Minimal social ingestion payload for M0 reference flows."""
 
@@ -19,7 +25,7 @@ class SocialIngestionEvent:
     content_hash: str
 
 
-@dataclass
+@dataclass(slots=True)
 class M0IngestionState:
     """State carried across M0 ingest -> resolve -> emit processing."""
 
@@ -30,7 +36,7 @@ class M0IngestionState:
 
 def _ingest_step(signal: Signal[SocialIngestionEvent], state: M0IngestionState) -> StepResult:
     emission = Emission(
-        emission_id=f"{signal.signal_id}:ingest",
+        emission_id=signal.signal_id + _INGEST_SUFFIX,
         emission_type="m0.ingest.accepted",
         caused_by=signal.signal_id,
         timestamp=signal.timestamp,
@@ -46,7 +52,7 @@ def _ingest_step(signal: Signal[SocialIngestionEvent], state: M0IngestionState)
 def _resolve_step(signal: Signal[SocialIngestionEvent], state: M0IngestionState) -> StepResult:
     entity_ref = f"{signal.payload.platform}:{signal.payload.actor_ref}"
     emission = Emission(
-        emission_id=f"{signal.signal_id}:resolve",
+        emission_id=signal.signal_id + _RESOLVE_SUFFIX,
         emission_type="m0.resolve.completed",
         caused_by=signal.signal_id,
         timestamp=signal.timestamp,
@@ -56,19 +62,18 @@ def _resolve_step(signal: Signal[SocialIngestionEvent], state: M0IngestionState)
         },
     )
 
-    def updater(_: M0IngestionState) -> M0IngestionState:
-        return M0IngestionState(
-            ingested_count=state.ingested_count + 1,
-            resolved_count=state.resolved_count + 1,
-            last_entity_ref=entity_ref,
-        )
+    def updater(current: M0IngestionState) -> M0IngestionState:
+        current.ingested_count += 1
+        current.resolved_count += 1
+        current.last_entity_ref = entity_ref
+        return current
 
     return [emission], updater
 
 
 def _emit_step(signal: Signal[SocialIngestionEvent], state: M0IngestionState) -> StepResult:
     emission = Emission(
-        emission_id=f"{signal.signal_id}:emit",
+        emission_id=signal.signal_id + _EMIT_SUFFIX,
         emission_type="m0.event.ready",
         caused_by=signal.signal_id,
         timestamp=signal.timestamp,
@@ -2,14 +2,21 @@
 
 from __future__ import annotations
 
+import sys
 from dataclasses import dataclass
 from datetime import datetime
+from functools import lru_cache
 
 from .core import Emission, Signal
 from .pipeline import Pipeline, StepResult
 
+# Stage emission-id suffixes, appended to the source signal_id.
+_PROFILE_SUFFIX = sys.intern(":profile")
+_SCORE_SUFFIX = sys.intern(":score")
+_ROUTE_SUFFIX = sys.intern(":route")
 
-@dataclass(frozen=True)
+
+@dataclass(frozen=True, slots=True)
 class M1ProfileSignal:
     """Minimal M1 profile payload aligned to stage boundaries."""
 
@@ -20,7 +27,16 @@ class M1ProfileSignal:
     channel: str
 
 
-@dataclass
+@dataclass(frozen=True, slots=True)
+class M1ScorePayload:
+    """Typed ``m1.scores.computed`` payload for pipelines built with ``typed_payloads``."""
+
+    profile_id: str
+    score: float
+    route_hint: str
+
+
+@dataclass(slots=True)
 class M1RoutingState:
     """State shared across M1 profile/score/route stages."""
 
@@ -32,7 +48,7 @@ class M1RoutingState:
 
 def _profile_stage(signal: Signal[M1ProfileSignal], state: M1RoutingState) -> StepResult:
     emission = Emission(
-        emission_id=f"{signal.signal_id}:profile",
+        emission_id=signal.signal_id + _PROFILE_SUFFIX,
         emission_type="m1.profile.enriched",
         caused_by=signal.signal_id,
         timestamp=signal.timestamp,
@@ -45,35 +61,51 @@ def _profile_stage(signal: Signal[M1ProfileSignal], state: M1RoutingState) -> St
     return [emission], None
 
 
-def _score_stage(signal: Signal[M1ProfileSignal], state: M1RoutingState) -> StepResult:
-    score = round((signal.payload.quality_score * 0.6) + (signal.payload.intent_score * 0.4), 4)
-    route = "priority_review" if score >= 0.75 else "standard_queue"
-    emission = Emission(
-        emission_id=f"{signal.signal_id}:score",
-        emission_type="m1.scores.computed",
-        caused_by=signal.signal_id,
-        timestamp=signal.timestamp,
-        payload={
-            "profile_id": signal.payload.profile_id,
-            "score": score,
-            "route_hint": route,
-        },
-    )
+# Route labels indexed by the route code returned from _score_and_route.
+_ROUTES = ("standard_queue", "priority_review")
+
+
+def _score_and_route(quality_score: float, intent_score: float) -> tuple[float, int]:
+    """Blend quality/intent into a 4-dp score and a route code (0=standard, 1=priority)."""
+
+    score = round((quality_score * 0.6) + (intent_score * 0.4), 4)
+    return score, int(score >= 0.75)
+
+
+@lru_cache(maxsize=2)
+def _make_score_stage(typed_payloads: bool):
+    # dict and M1ScorePayload share the same keyword signature.
+    payload_type = M1ScorePayload if typed_payloads else dict
 
-    def updater(_: M1RoutingState) -> M1RoutingState:
-        return M1RoutingState(
-            profiled_count=state.profiled_count + 1,
-            scored_count=state.scored_count + 1,
-            routed_count=state.routed_count,
-            last_route=route,
+    def _score_stage(signal: Signal[M1ProfileSignal], state: M1RoutingState) -> StepResult:
+        score, route_code = _score_and_route(signal.payload.quality_score, signal.payload.intent_score)
+        route = _ROUTES[route_code]
+        emission = Emission(
+            emission_id=signal.signal_id + _SCORE_SUFFIX,
+            emission_type="m1.scores.computed",
+            caused_by=signal.signal_id,
+            timestamp=signal.timestamp,
+            payload=payload_type(
+                profile_id=signal.payload.profile_id,
+                score=score,
+                route_hint=route,
+            ),
         )
 
-    return [emission], updater
+        def updater(current: M1RoutingState) -> M1RoutingState:
+            current.profiled_count += 1
+            current.scored_count += 1
+            current.last_route = route
+            return current
+
+        return [emission], updater
+
+    return _score_stage
 
 
 def _route_stage(signal: Signal[M1ProfileSignal], state: M1RoutingState) -> StepResult:
     emission = Emission(
-        emission_id=f"{signal.signal_id}:route",
+        emission_id=signal.signal_id + _ROUTE_SUFFIX,
         emission_type="m1.route.selected",
         caused_by=signal.signal_id,
         timestamp=signal.timestamp,
@@ -83,22 +115,22 @@ def _route_stage(signal: Signal[M1ProfileSignal], state: M1RoutingState) -> Step
         },
     )
 
-    def updater(_: M1RoutingState) -> M1RoutingState:
-        return M1RoutingState(
-            profiled_count=state.profiled_count,
-            scored_count=state.scored_count,
-            routed_count=state.routed_count + 1,
-            last_route=state.last_route,
-        )
+    def updater(current: M1RoutingState) -> M1RoutingState:
+        current.routed_count += 1
+        return current
 
     return [emission], updater
 
 
-def build_m1_routing_pipeline() -> Pipeline:
-    """Create deterministic M1 profile -> score -> route composition."""
+def build_m1_routing_pipeline(*, typed_payloads: bool = False) -> Pipeline:
+    """Create deterministic M1 profile -> score -> route composition.
+
+    With ``typed_payloads=True`` score emissions carry an ``M1ScorePayload``
+    instead of a dict.
+    """
 
     return Pipeline(
-        steps=[_profile_stage, _score_stage, _route_stage],
+        steps=[_profile_stage, _make_score_stage(typed_payloads), _route_stage],
         name="m1_profile_score_route",
     )
 
@@ -2,15 +2,20 @@
 
 from __future__ import annotations
 
-from dataclasses import dataclass, field
+import sys
+from dataclasses import asdict, dataclass, field
 from datetime import datetime
 from typing import List
 
 from .core import Emission, Signal
 from .pipeline import Pipeline, StepResult
 
+# Stage emission-id suffixes, appended to the source signal_id.
+_RECOMMENDATION_SUFFIX = sys.intern(":recommendation")
+_DRAFT_SUFFIX = sys.intern(":draft")
 
-@dataclass(frozen=True)
+
+@dataclass(frozen=True, slots=True)
 class RecommendationCandidate:
     """Candidate item for M2 recommendation ranking."""
 
@@ -20,16 +25,37 @@ class RecommendationCandidate:
     context_boost: float = 0.0
 
 
-@dataclass(frozen=True)
+@dataclass(frozen=True, slots=True)
 class M2RecommendationSignal:
     """M2 input payload carrying candidates and prompt context."""
 
     audience_id: str
     prompt: str
     candidates: tuple[RecommendationCandidate, ...]
+    # Column views of ``candidates`` (same order) derived at construction for the ranking stage.
+    candidate_ids: tuple[str, ...] = field(init=False, repr=False, compare=False)
+    rank_scores: tuple[float, ...] = field(init=False, repr=False, compare=False)
+
+    def __post_init__(self) -> None:
+        # Blended score bucketed to 3 dp so near-equal values tie and fall back to candidate_id.
+        object.__setattr__(self, "candidate_ids", tuple(item.candidate_id for item in self.candidates))
+        object.__setattr__(
+            self,
+            "rank_scores",
+            tuple(round(item.score + item.context_boost, 3) for item in self.candidates),
+        )
+
+    def to_dict(self) -> dict:
+        """Serialize the input fields only; derived columns are rebuilt on construction."""
+
+        return {
+            "audience_id": self.audience_id,
+            "prompt": self.prompt,
+            "candidates": tuple(asdict(item) for item in self.candidates),
+        }
 
 
-@dataclass
+@dataclass(slots=True)
 class M2RecommendationState:
     """State used across ranking and draft shaping stages."""
 
@@ -37,22 +63,21 @@ class M2RecommendationState:
     drafted_count: int = 0
     latest_top_candidate_id: str = ""
     latest_ranked_ids: List[str] = field(default_factory=list)
+    latest_top_candidate: RecommendationCandidate | None = None
 
 
 def _rank_stage(signal: Signal[M2RecommendationSignal], state: M2RecommendationState) -> StepResult:
-    # Bucket the blended score so near-equal values sort deterministically by candidate_id.
-    ranked = sorted(
-        signal.payload.candidates,
-        key=lambda candidate: (
-            -round(candidate.score + candidate.context_boost, 3),
-            candidate.candidate_id,
-        ),
+    # Sort on the precomputed columns; the trailing index keeps duplicate ids stable.
+    payload = signal.payload
+    candidate_ids = payload.candidate_ids
+    order = sorted(
+        zip([-score for score in payload.rank_scores], candidate_ids, range(len(candidate_ids)))
     )
-    ranked_ids = [item.candidate_id for item in ranked]
-    top = ranked[0]
+    ranked_ids = [candidate_id for _, candidate_id, _ in order]
+    top = payload.candidates[order[0][2]]
 
     emission = Emission(
-        emission_id=f"{signal.signal_id}:recommendation",
+        emission_id=signal.signal_id + _RECOMMENDATION_SUFFIX,
         emission_type="m2.recommendation.ranked",
         caused_by=signal.signal_id,
         timestamp=signal.timestamp,
@@ -63,24 +88,23 @@ def _rank_stage(signal: Signal[M2RecommendationSignal], state: M2RecommendationS
         },
     )
 
-    def updater(_: M2RecommendationState) -> M2RecommendationState:
-        return M2RecommendationState(
-            ranked_count=state.ranked_count + 1,
-            drafted_count=state.drafted_count,
-            latest_top_candidate_id=top.candidate_id,
-            latest_ranked_ids=ranked_ids,
-        )
+    def updater(current: M2RecommendationState) -> M2RecommendationState:
+        current.ranked_count += 1
+        current.latest_top_candidate_id = top.candidate_id
+        current.latest_ranked_ids = ranked_ids
+        current.latest_top_candidate = top
+        return current
 
     return [emission], updater
 
 
 def _draft_stage(signal: Signal[M2RecommendationSignal], state: M2RecommendationState) -> StepResult:
-    if not state.latest_top_candidate_id:
+    top = state.latest_top_candidate
+    if top is None:
         return [], None
 
-    top = next(item for item in signal.payload.candidates if item.candidate_id == state.latest_top_candidate_id)
     emission = Emission(
-        emission_id=f"{signal.signal_id}:draft",
+        emission_id=signal.signal_id + _DRAFT_SUFFIX,
         emission_type="m2.draft.generated",
         caused_by=signal.signal_id,
         timestamp=signal.timestamp,
@@ -91,13 +115,9 @@ def _draft_stage(signal: Signal[M2RecommendationSignal], state: M2Recommendation
         },
     )
 
-    def updater(_: M2RecommendationState) -> M2RecommendationState:
-        return M2RecommendationState(
-            ranked_count=state.ranked_count,
-            drafted_count=state.drafted_count + 1,
-            latest_top_candidate_id=state.latest_top_candidate_id,
-            latest_ranked_ids=list(state.latest_ranked_ids),
-        )
+    def updater(current: M2RecommendationState) -> M2RecommendationState:
+        current.drafted_count += 1
+        return current
 
     return [emission], updater
 
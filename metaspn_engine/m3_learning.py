@@ -2,14 +2,22 @@
 
 from __future__ import annotations
 
+import sys
 from dataclasses import dataclass
 from datetime import datetime
+from functools import lru_cache
 
 from .core import Emission, Signal
 from .pipeline import Pipeline, StepResult
 
+# Stage emission-id suffixes, appended to the source signal_id.
+_ATTEMPT_SUFFIX = sys.intern(":attempt")
+_OUTCOME_SUFFIX = sys.intern(":outcome")
+_FAILURE_SUFFIX = sys.intern(":failure")
+_CALIBRATION_SUFFIX = sys.intern(":calibration")
 
-@dataclass(frozen=True)
+
+@dataclass(frozen=True, slots=True)
 class M3AttemptSignal:
     """Minimal learning-attempt payload aligned with M3 stage boundaries."""
 
@@ -20,7 +28,16 @@ class M3AttemptSignal:
     observed_score: float
 
 
-@dataclass
+@dataclass(frozen=True, slots=True)
+class M3OutcomePayload:
+    """Typed ``m3.outcome.evaluated`` payload for pipelines built with ``typed_payloads``."""
+
+    attempt_id: str
+    passed: bool
+    gap: float
+
+
+@dataclass(slots=True)
 class M3LearningState:
     """State threaded through attempt -> calibration processing."""
 
@@ -32,9 +49,30 @@ class M3LearningState:
     latest_failure_class: str = ""
 
 
-def _attempt_stage(signal: Signal[M3AttemptSignal], state: M3LearningState) -> StepResult:
-    emission = Emission(
-        emission_id=f"{signal.signal_id}:attempt",
+# Failure class labels indexed by the class code returned from _classify_gap.
+_FAILURE_CLASSES = ("none", "minor_gap", "major_gap")
+# Calibration proposals indexed by the same failure class code.
+_PROPOSALS = ("maintain", "increase_support", "rebuild_foundation")
+# Proposal lookup for the staged calibration step, keyed by failure class label.
+_PROPOSAL_BY_CLASS = dict(zip(_FAILURE_CLASSES, _PROPOSALS))
+
+
+def _score_gap(expected_score: float, observed_score: float) -> float:
+    """Expected-minus-observed gap rounded to 4 dp; positive means underperformance."""
+
+    return round(expected_score - observed_score, 4)
+
+
+def _classify_gap(gap: float) -> int:
+    """Map a gap to a failure class code (0=none, 1=minor, 2=major)."""
+
+    # Sum of comparisons instead of an if-ladder: 0 for gap <= 0, +1 above 0, +1 at 0.1.
+    return (gap > 0) + (gap >= 0.1)
+
+
+def _attempt_emission(signal: Signal[M3AttemptSignal]) -> Emission:
+    return Emission(
+        emission_id=signal.signal_id + _ATTEMPT_SUFFIX,
         emission_type="m3.attempt.snapshot",
         caused_by=signal.signal_id,
         timestamp=signal.timestamp,
@@ -46,42 +84,27 @@ def _attempt_stage(signal: Signal[M3AttemptSignal], state: M3LearningState) -> S
             "observed_score": signal.payload.observed_score,
         },
     )
-    return [emission], None
 
 
-def _outcome_stage(signal: Signal[M3AttemptSignal], state: M3LearningState) -> StepResult:
-    gap = round(signal.payload.expected_score - signal.payload.observed_score, 4)
-    passed = signal.payload.observed_score >= signal.payload.expected_score
-    emission = Emission(
-        emission_id=f"{signal.signal_id}:outcome",
+def _outcome_emission(
+    signal: Signal[M3AttemptSignal], gap: float, passed: bool, payload_type: type = dict
+) -> Emission:
+    return Emission(
+        emission_id=signal.signal_id + _OUTCOME_SUFFIX,
         emission_type="m3.outcome.evaluated",
         caused_by=signal.signal_id,
         timestamp=signal.timestamp,
-        payload={
-            "attempt_id": signal.payload.attempt_id,
-            "passed": passed,
-            "gap": gap,
-        },
+        payload=payload_type(
+            attempt_id=signal.payload.attempt_id,
+            passed=passed,
+            gap=gap,
+        ),
     )
 
-    def updater(_: M3LearningState) -> M3LearningState:
-        return M3LearningState(
-            attempts_seen=state.attempts_seen + 1,
-            outcomes_emitted=state.outcomes_emitted + 1,
-            failures_emitted=state.failures_emitted,
-            calibrations_emitted=state.calibrations_emitted,
-            latest_gap=gap,
-            latest_failure_class=state.latest_failure_class,
-        )
 
-    return [emission], updater
-
-
-def _failure_stage(signal: Signal[M3AttemptSignal], state: M3LearningState) -> StepResult:
-    gap = state.latest_gap
-    failure_class = "none" if gap <= 0 else ("minor_gap" if gap < 0.1 else "major_gap")
-    emission = Emission(
-        emission_id=f"{signal.signal_id}:failure",
+def _failure_emission(signal: Signal[M3AttemptSignal], failure_class: str, gap: float) -> Emission:
+    return Emission(
+        emission_id=signal.signal_id + _FAILURE_SUFFIX,
         emission_type="m3.failure.classified",
         caused_by=signal.signal_id,
         timestamp=signal.timestamp,
@@ -92,53 +115,124 @@ def _failure_stage(signal: Signal[M3AttemptSignal], state: M3LearningState) -> S
         },
     )
 
-    def updater(_: M3LearningState) -> M3LearningState:
-        return M3LearningState(
-            attempts_seen=state.attempts_seen,
-            outcomes_emitted=state.outcomes_emitted,
-            failures_emitted=state.failures_emitted + 1,
-            calibrations_emitted=state.calibrations_emitted,
-            latest_gap=state.latest_gap,
-            latest_failure_class=failure_class,
-        )
 
-    return [emission], updater
-
-
-def _calibration_stage(signal: Signal[M3AttemptSignal], state: M3LearningState) -> StepResult:
-    proposal = "maintain" if state.latest_failure_class == "none" else "increase_support"
-    if state.latest_failure_class == "major_gap":
-        proposal = "rebuild_foundation"
-    emission = Emission(
-        emission_id=f"{signal.signal_id}:calibration",
+def _calibration_emission(
+    signal: Signal[M3AttemptSignal], proposal: str, failure_class: str
+) -> Emission:
+    return Emission(
+        emission_id=signal.signal_id + _CALIBRATION_SUFFIX,
         emission_type="m3.calibration.proposed",
         caused_by=signal.signal_id,
         timestamp=signal.timestamp,
         payload={
             "attempt_id": signal.payload.attempt_id,
             "proposal": proposal,
-            "failure_class": state.latest_failure_class,
+            "failure_class": failure_class,
         },
     )
 
-    def updater(_: M3LearningState) -> M3LearningState:
-        return M3LearningState(
-            attempts_seen=state.attempts_seen,
-            outcomes_emitted=state.outcomes_emitted,
-            failures_emitted=state.failures_emitted,
-            calibrations_emitted=state.calibrations_emitted + 1,
-            latest_gap=state.latest_gap,
-            latest_failure_class=state.latest_failure_class,
-        )
 
-    return [emission], updater
+def _attempt_stage(signal: Signal[M3AttemptSignal], state: M3LearningState) -> StepResult:
+    return [_attempt_emission(signal)], None
+
+
+@lru_cache(maxsize=2)
+def _make_outcome_stage(typed_payloads: bool):
+    payload_type = M3OutcomePayload if typed_payloads else dict
+
+    def _outcome_stage(signal: Signal[M3AttemptSignal], state: M3LearningState) -> StepResult:
+        gap = _score_gap(signal.payload.expected_score, signal.payload.observed_score)
+        passed = signal.payload.observed_score >= signal.payload.expected_score
+
+        def updater(current: M3LearningState) -> M3LearningState:
+            current.attempts_seen += 1
+            current.outcomes_emitted += 1
+            current.latest_gap = gap
+            return current
+
+        return [_outcome_emission(signal, gap, passed, payload_type)], updater
+
+    return _outcome_stage
+
+
+def _failure_stage(signal: Signal[M3AttemptSignal], state: M3LearningState) -> StepResult:
+    gap = state.latest_gap
+    failure_class = _FAILURE_CLASSES[_classify_gap(gap)]
+
+    def updater(current: M3LearningState) -> M3LearningState:
+        current.failures_emitted += 1
+        current.latest_failure_class = failure_class
+        return current
+
+    return [_failure_emission(signal, failure_class, gap)], updater
+
+
+def _calibration_stage(signal: Signal[M3AttemptSignal], state: M3LearningState) -> StepResult:
+    # Any other label (e.g. no failure classified yet) falls back to increase_support.
+    proposal = _PROPOSAL_BY_CLASS.get(state.latest_failure_class, "increase_support")
+
+    def updater(current: M3LearningState) -> M3LearningState:
+        current.calibrations_emitted += 1
+        return current
+
+    return [_calibration_emission(signal, proposal, state.latest_failure_class)], updater
+
+
+@lru_cache(maxsize=2)
+def _make_fused_learning_step(typed_payloads: bool):
+    payload_type = M3OutcomePayload if typed_payloads else dict
+
+    def _fused_learning_step(signal: Signal[M3AttemptSignal], state: M3LearningState) -> StepResult:
+        gap = _score_gap(signal.payload.expected_score, signal.payload.observed_score)
+        passed = signal.payload.observed_score >= signal.payload.expected_score
+        class_code = _classify_gap(gap)
+        failure_class = _FAILURE_CLASSES[class_code]
+        proposal = _PROPOSALS[class_code]
+
+        emissions = [
+            _attempt_emission(signal),
+            _outcome_emission(signal, gap, passed, payload_type),
+            _failure_emission(signal, failure_class, gap),
+            _calibration_emission(signal, proposal, failure_class),
+        ]
+
+        def updater(current: M3LearningState) -> M3LearningState:
+            current.attempts_seen += 1
+            current.outcomes_emitted += 1
+            current.failures_emitted += 1
+            current.calibrations_emitted += 1
+            current.latest_gap = gap
+            current.latest_failure_class = failure_class
+            return current
+
+        return emissions, updater
+
+    return _fused_learning_step
+
+
+def build_m3_learning_pipeline(*, typed_payloads: bool = False) -> Pipeline:
+    """Create deterministic attempt -> outcome -> failure -> calibration flow.
+
+    With ``typed_payloads=True`` outcome emissions carry an ``M3OutcomePayload``
+    instead of a dict.
+    """
+
+    return Pipeline(
+        steps=[
+            _attempt_stage,
+            _make_outcome_stage(typed_payloads),
+            _failure_stage,
+            _calibration_stage,
+        ],
+        name="m3_attempt_outcome_failure_calibration",
+    )
 
 
-def build_m3_learning_pipeline() -> Pipeline:
-    """Create deterministic attempt -> outcome -> failure -> calibration flow."""
+def build_m3_learning_pipeline_fused(*, typed_payloads: bool = False) -> Pipeline:
+    """Create the M3 flow as one fused step with identical emissions and state."""
 
     return Pipeline(
-        steps=[_attempt_stage, _outcome_stage, _failure_stage, _calibration_stage],
+        steps=[_make_fused_learning_step(typed_payloads)],
         name="m3_attempt_outcome_failure_calibration",
     )
 
@@ -2,14 +2,38 @@
 
 from __future__ import annotations
 
-from dataclasses import dataclass, field
+import sys
+from dataclasses import asdict, dataclass, field
+from functools import lru_cache
+from math import floor, fsum, inf, lcm
+from operator import sub
 from datetime import datetime
+from typing import Callable, Sequence
 
 from .core import Emission, Signal
 from .pipeline import Pipeline, StepResult
 
-
-@dataclass(frozen=True)
+# Stage emission-id suffixes, appended to the source signal_id.
+_ATTENTION_SUFFIX = sys.intern(":attention")
+_POOL_SUFFIX = sys.intern(":pool")
+_STAKER_SUFFIX = sys.intern(":staker")
+
+# Constant per-stage trace fields; each emission adds its own caused_by.
+_ATTENTION_TRACE = {
+    "stage": "attention_share",
+    "formula": "game_attention / sum(game_attention)",
+}
+_POOL_TRACE = {
+    "stage": "game_reward_pool_allocation",
+    "formula": "total_reward_pool * attention_share",
+}
+_STAKER_TRACE = {
+    "stage": "staker_share_allocation",
+    "formula": "game_pool * (effective_stake / sum(effective_stake))",
+}
+
+
+@dataclass(frozen=True, slots=True)
 class StakerPosition:
     """Single staker position within a game reward pool."""
 
@@ -18,25 +42,116 @@ class StakerPosition:
     conviction_days: int = 0
 
 
-@dataclass(frozen=True)
+@dataclass(frozen=True, slots=True)
 class GameRewardInput:
     """Per-game input used to compute reward attention and allocations."""
 
     game_id: str
     attention_weight: float
     stakers: tuple[StakerPosition, ...]
+    # Column views of ``stakers`` (same order) derived at construction for the allocation loop.
+    staker_ids: tuple[str, ...] = field(init=False, repr=False, compare=False)
+    stake_weights: tuple[float, ...] = field(init=False, repr=False, compare=False)
+    conviction_days: tuple[int, ...] = field(init=False, repr=False, compare=False)
+
+    def __post_init__(self) -> None:
+        # Canonicalize staker order once so reward stages can iterate without re-sorting.
+        stakers = tuple(sorted(self.stakers, key=lambda item: item.staker_id))
+        object.__setattr__(self, "stakers", stakers)
+        object.__setattr__(self, "staker_ids", tuple(item.staker_id for item in stakers))
+        object.__setattr__(self, "stake_weights", tuple(item.stake_weight for item in stakers))
+        object.__setattr__(self, "conviction_days", tuple(item.conviction_days for item in stakers))
+
+    def to_dict(self) -> dict:
+        """Serialize the input fields only; derived columns are rebuilt on construction."""
+
+        return {
+            "game_id": self.game_id,
+            "attention_weight": self.attention_weight,
+            "stakers": tuple(asdict(item) for item in self.stakers),
+        }
 
 
-@dataclass(frozen=True)
+@dataclass(frozen=True, slots=True)
 class M4RewardSignal:
     """Season-level reward input payload for deterministic pipeline execution."""
 
     season_id: str
     total_reward_pool: float
     games: tuple[GameRewardInput, ...]
+    # Season-wide staker columns: game g owns [game_offsets[g], game_offsets[g + 1]).
+    game_ids: tuple[str, ...] = field(init=False, repr=False, compare=False)
+    stake_weights: tuple[float, ...] = field(init=False, repr=False, compare=False)
+    conviction_days: tuple[int, ...] = field(init=False, repr=False, compare=False)
+    game_offsets: tuple[int, ...] = field(init=False, repr=False, compare=False)
+
+    def __post_init__(self) -> None:
+        # Canonicalize game order once so reward stages can iterate without re-sorting.
+        games = tuple(sorted(self.games, key=lambda item: item.game_id))
+        offsets = [0]
+        for game in games:
+            offsets.append(offsets[-1] + len(game.stakers))
+        object.__setattr__(self, "games", games)
+        object.__setattr__(self, "game_ids", tuple(item.game_id for item in games))
+        object.__setattr__(
+            self, "stake_weights", tuple(weight for game in games for weight in game.stake_weights)
+        )
+        object.__setattr__(
+            self, "conviction_days", tuple(days for game in games for days in game.conviction_days)
+        )
+        object.__setattr__(self, "game_offsets", tuple(offsets))
+
+    def to_dict(self) -> dict:
+        """Serialize the input fields only; derived columns are rebuilt on construction."""
+
+        return {
+            "season_id": self.season_id,
+            "total_reward_pool": self.total_reward_pool,
+            "games": tuple(item.to_dict() for item in self.games),
+        }
+
+
+@dataclass(frozen=True, slots=True)
+class M4RewardBatchSignal:
+    """Multi-season reward input allocated in one pass by the batch pipeline."""
+
+    seasons: tuple[M4RewardSignal, ...]
+    # Batch-wide staker columns stacked in season order: season s owns games
+    # [season_offsets[s], season_offsets[s + 1]) and game g owns stakers
+    # [game_offsets[g], game_offsets[g + 1]).
+    stake_weights: tuple[float, ...] = field(init=False, repr=False, compare=False)
+    conviction_days: tuple[int, ...] = field(init=False, repr=False, compare=False)
+    game_offsets: tuple[int, ...] = field(init=False, repr=False, compare=False)
+    season_offsets: tuple[int, ...] = field(init=False, repr=False, compare=False)
+
+    def __post_init__(self) -> None:
+        # Emission ids embed the season_id, so duplicates would collide downstream.
+        season_ids = [season.season_id for season in self.seasons]
+        if len(set(season_ids)) != len(season_ids):
+            raise ValueError(f"Duplicate season_id in M4 batch: {season_ids}")
+        game_offsets = [0]
+        season_offsets = [0]
+        for season in self.seasons:
+            base = game_offsets[-1]
+            game_offsets.extend(base + offset for offset in season.game_offsets[1:])
+            season_offsets.append(len(game_offsets) - 1)
+        seasons = self.seasons
+        object.__setattr__(
+            self, "stake_weights", tuple(weight for item in seasons for weight in item.stake_weights)
+        )
+        object.__setattr__(
+            self, "conviction_days", tuple(days for item in seasons for days in item.conviction_days)
+        )
+        object.__setattr__(self, "game_offsets", tuple(game_offsets))
+        object.__setattr__(self, "season_offsets", tuple(season_offsets))
+
+    def to_dict(self) -> dict:
+        """Serialize the input fields only; derived columns are rebuilt on construction."""
+
+        return {"seasons": tuple(item.to_dict() for item in self.seasons)}
 
 
-@dataclass(frozen=True)
+@dataclass(frozen=True, slots=True)
 class M4RewardConfig:
     """Configurable controls for reward experiments."""
 
@@ -45,9 +160,13 @@ class M4RewardConfig:
     early_conviction_days_threshold: int = 30
 
 
-@dataclass
+@dataclass(slots=True)
 class M4RewardState:
-    """State threaded through attention -> pool -> staker allocation stages."""
+    """State threaded through attention -> pool -> staker allocation stages.
+
+    The ``latest_*`` maps are shared with the emission payloads that produced them
+    rather than copied, so treat them as read-only.
+    """
 
     seasons_processed: int = 0
     latest_season_id: str = ""
@@ -57,157 +176,341 @@ class M4RewardState:
     total_distributed: float = 0.0
 
 
-def _attention_share_stage(signal: Signal[M4RewardSignal], state: M4RewardState) -> StepResult:
-    games_sorted = sorted(signal.payload.games, key=lambda item: item.game_id)
-    total_attention = sum(max(item.attention_weight, 0.0) for item in games_sorted)
+# Pools and outputs are integer micro-units (1e-6); each output is rounded half-up once.
+_MICRO = 1_000_000
+
+
+def _to_micro(value: float) -> int:
+    return round(value * _MICRO)
+
+
+def _exact_weights(values: Sequence[float]) -> tuple[list[int], int]:
+    """Express non-negative weights as integer numerators over their least common denominator.
+
+    Ratios of the numerators equal ratios of the inputs exactly for floats, ints
+    and ``Fraction`` weights alike, so weights are never rounded.
+    """
+
+    if not values:
+        return [], 1
+    numerators, scales = zip(*[value.as_integer_ratio() for value in values])
+    denominator = lcm(*scales)
+    return [numerator * (denominator // scale) for numerator, scale in zip(numerators, scales)], denominator
+
+
+def _clamped(values: Sequence[float]) -> Sequence[float]:
+    """Clamp negative weights to zero, skipping the copy when none are negative."""
+
+    if min(values, default=0.0) < 0:
+        return [max(value, 0.0) for value in values]
+    return values
+
+
+def _div_round(numerator: int, denominator: int) -> int:
+    """Integer division rounded half-up, for positive denominators."""
 
-    if not games_sorted:
+    return (2 * numerator + denominator) // (2 * denominator)
+
+
+@lru_cache(maxsize=64)
+def _equal_share(game_count: int) -> float:
+    """Rounded equal share used when no game carries positive attention."""
+
+    return _div_round(_MICRO, game_count) / _MICRO
+
+
+def _attention_shares(games: tuple[GameRewardInput, ...]) -> tuple[dict[str, float], int]:
+    """Per-game attention shares plus the clamped micro-unit attention total."""
+
+    # Clamp weights once and reuse them for both the total and the per-game shares.
+    weights, denominator = _exact_weights(_clamped([item.attention_weight for item in games]))
+    total_weight = sum(weights)
+
+    if not games:
         shares: dict[str, float] = {}
-    elif total_attention > 0:
+    elif total_weight > 0:
         shares = {
-            item.game_id: round(max(item.attention_weight, 0.0) / total_attention, 6)
-            for item in games_sorted
+            item.game_id: _div_round(weight * _MICRO, total_weight) / _MICRO
+            for item, weight in zip(games, weights)
         }
     else:
-        equal_share = round(1.0 / len(games_sorted), 6)
-        shares = {item.game_id: equal_share for item in games_sorted}
+        shares = dict.fromkeys((item.game_id for item in games), _equal_share(len(games)))
+    return shares, _div_round(total_weight * _MICRO, denominator)
 
-    emission = Emission(
-        emission_id=f"{signal.signal_id}:attention",
+
+def _game_pools(total_reward_pool: int, shares: dict[str, float]) -> dict[str, float]:
+    """Split a micro-unit season pool across games by attention share."""
+
+    # Shares are inserted in canonical game_id order, so dict order is already sorted.
+    return {
+        game_id: _div_round(total_reward_pool * _to_micro(share), _MICRO) / _MICRO
+        for game_id, share in shares.items()
+    }
+
+
+def _attention_emission(
+    signal: Signal, emission_id: str, season_id: str, shares: dict[str, float], total_attention: int
+) -> Emission:
+    return Emission(
+        emission_id=emission_id,
         emission_type="m4.rewards.attention.computed",
         caused_by=signal.signal_id,
         timestamp=signal.timestamp,
         payload={
-            "season_id": signal.payload.season_id,
+            "season_id": season_id,
             "attention_share_by_game": shares,
-            "total_attention": round(total_attention, 6),
-        },
-        metadata={
-            "trace": {
-                "stage": "attention_share",
-                "caused_by": signal.signal_id,
-                "formula": "game_attention / sum(game_attention)",
-            }
+            "total_attention": total_attention / _MICRO,
         },
+        metadata={"trace": {**_ATTENTION_TRACE, "caused_by": signal.signal_id}},
     )
 
-    def updater(_: M4RewardState) -> M4RewardState:
-        return M4RewardState(
-            seasons_processed=state.seasons_processed,
-            latest_season_id=signal.payload.season_id,
-            latest_attention_share_by_game=shares,
-            latest_game_pool_by_game=dict(state.latest_game_pool_by_game),
-            latest_staker_rewards_by_game=dict(state.latest_staker_rewards_by_game),
-            total_distributed=state.total_distributed,
-        )
-
-    return [emission], updater
-
-
-def _game_pool_stage(signal: Signal[M4RewardSignal], state: M4RewardState) -> StepResult:
-    pool_by_game = {
-        game_id: round(signal.payload.total_reward_pool * share, 6)
-        for game_id, share in sorted(state.latest_attention_share_by_game.items())
-    }
 
-    emission = Emission(
-        emission_id=f"{signal.signal_id}:pool",
+def _pool_emission(
+    signal: Signal,
+    emission_id: str,
+    season_id: str,
+    total_reward_pool: int,
+    pool_by_game: dict[str, float],
+) -> Emission:
+    return Emission(
+        emission_id=emission_id,
         emission_type="m4.rewards.pool.allocated",
         caused_by=signal.signal_id,
         timestamp=signal.timestamp,
         payload={
-            "season_id": signal.payload.season_id,
-            "total_reward_pool": round(signal.payload.total_reward_pool, 6),
+            "season_id": season_id,
+            "total_reward_pool": total_reward_pool / _MICRO,
             "reward_pool_by_game": pool_by_game,
         },
-        metadata={
-            "trace": {
-                "stage": "game_reward_pool_allocation",
-                "caused_by": signal.signal_id,
-                "formula": "total_reward_pool * attention_share",
-            }
+        metadata={"trace": {**_POOL_TRACE, "caused_by": signal.signal_id}},
+    )
+
+
+def _staker_emission(
+    signal: Signal,
+    emission_id: str,
+    season_id: str,
+    reward_by_game: dict[str, dict[str, float]],
+    total_distributed: float,
+    config: M4RewardConfig,
+) -> Emission:
+    return Emission(
+        emission_id=emission_id,
+        emission_type="m4.rewards.staker.allocated",
+        caused_by=signal.signal_id,
+        timestamp=signal.timestamp,
+        payload={
+            "season_id": season_id,
+            "staker_reward_by_game": reward_by_game,
+            "total_distributed": total_distributed,
+            "config": {
+                "enable_early_conviction_multiplier": config.enable_early_conviction_multiplier,
+                "early_conviction_multiplier": config.early_conviction_multiplier,
+                "early_conviction_days_threshold": config.early_conviction_days_threshold,
+            },
         },
+        metadata={"trace": {**_STAKER_TRACE, "caused_by": signal.signal_id}},
     )
 
-    def updater(_: M4RewardState) -> M4RewardState:
-        return M4RewardState(
-            seasons_processed=state.seasons_processed,
-            latest_season_id=state.latest_season_id,
-            latest_attention_share_by_game=dict(state.latest_attention_share_by_game),
-            latest_game_pool_by_game=pool_by_game,
-            latest_staker_rewards_by_game=dict(state.latest_staker_rewards_by_game),
-            total_distributed=state.total_distributed,
-        )
+
+def _attention_share_stage(signal: Signal[M4RewardSignal], state: M4RewardState) -> StepResult:
+    shares, total_attention = _attention_shares(signal.payload.games)
+    emission = _attention_emission(
+        signal,
+        signal.signal_id + _ATTENTION_SUFFIX,
+        signal.payload.season_id,
+        shares,
+        total_attention,
+    )
+
+    def updater(current: M4RewardState) -> M4RewardState:
+        current.latest_season_id = signal.payload.season_id
+        current.latest_attention_share_by_game = shares
+        return current
+
+    return [emission], updater
+
+
+def _game_pool_stage(signal: Signal[M4RewardSignal], state: M4RewardState) -> StepResult:
+    total_reward_pool = _to_micro(signal.payload.total_reward_pool)
+    pool_by_game = _game_pools(total_reward_pool, state.latest_attention_share_by_game)
+    emission = _pool_emission(
+        signal,
+        signal.signal_id + _POOL_SUFFIX,
+        signal.payload.season_id,
+        total_reward_pool,
+        pool_by_game,
+    )
+
+    def updater(current: M4RewardState) -> M4RewardState:
+        current.latest_game_pool_by_game = pool_by_game
+        return current
 
     return [emission], updater
 
 
+def _allocate_game_pool(game_pool: int, effective_weights: list[int]) -> list[int]:
+    """Split one micro-unit game pool by exact effective stake share, in input order."""
+
+    total_effective_weight = sum(effective_weights)
+    if game_pool == 0 or total_effective_weight <= 0:
+        return [0] * len(effective_weights)
+    # _div_round inlined: this is the per-staker hot loop.
+    twice_pool, twice_total = 2 * game_pool, 2 * total_effective_weight
+    return [(twice_pool * weight + total_effective_weight) // twice_total for weight in effective_weights]
+
+
+# Float quotients below carry at most ~8 ulps of relative error; 2**-48 leaves 4x headroom.
+_FAST_PATH_TOLERANCE = 2.0**-48
+_FAST_PATH_MIN_TOTAL = 2.0**-900
+
+
+def _fast_allocate_game_pool(game_pool: int, effective_weights: list[float]) -> list[int] | None:
+    """Float version of ``_allocate_game_pool`` for float weights, or ``None`` if it cannot be trusted.
+
+    Every shifted quotient is within ``game_pool * _FAST_PATH_TOLERANCE`` of its exact
+    value, so flooring it is exact unless it lies that close to an integer; those
+    games, like overflowing or vanishing totals, fall back to integer arithmetic.
+    """
+
+    if not 0 < game_pool < 2**52:
+        return None
+    try:
+        total_effective_weight = fsum(effective_weights)
+    except OverflowError:
+        return None
+    if not _FAST_PATH_MIN_TOTAL <= total_effective_weight < inf:
+        return None
+    scale = game_pool / total_effective_weight
+    shifted = [weight * scale + 0.5 for weight in effective_weights]
+    allocations = list(map(floor, shifted))
+    fractions = list(map(sub, shifted, allocations))
+    tolerance = game_pool * _FAST_PATH_TOLERANCE
+    if min(fractions) <= tolerance or max(fractions) >= 1.0 - tolerance:
+        return None
+    return allocations
+
+
+def _is_float_column(values: Sequence[float]) -> bool:
+    return not values or set(map(type, values)) == {float}
+
+
+_GameAllocator = Callable[[int, Sequence[float], Sequence[int]], list[int]]
+
+
+def _allocate_rewards(
+    game_pools: list[int],
+    stake_weights: tuple[float, ...],
+    conviction_days: tuple[int, ...],
+    game_offsets: tuple[int, ...],
+    allocate_game: _GameAllocator,
+) -> list[int]:
+    """Split every game pool over its slice of the flat stake columns."""
+
+    allocations: list[int] = []
+    for index, game_pool in enumerate(game_pools):
+        start, end = game_offsets[index], game_offsets[index + 1]
+        allocations += allocate_game(game_pool, stake_weights[start:end], conviction_days[start:end])
+    return allocations
+
+
+def _make_game_allocator(config: M4RewardConfig) -> _GameAllocator:
+    # Resolve the multiplier toggle once at build time so the per-staker loop stays branch-free.
+    # Exact weights are built per game: only ratios within a game matter, and a tiny stake
+    # elsewhere must not widen every other game's integers.
+    if not config.enable_early_conviction_multiplier:
+        def _allocate_raw(
+            game_pool: int, stake_weights: Sequence[float], conviction_days: Sequence[int]
+        ) -> list[int]:
+            weights = _clamped(stake_weights)
+            if _is_float_column(weights):
+                allocations = _fast_allocate_game_pool(game_pool, weights)
+                if allocations is not None:
+                    return allocations
+            return _allocate_game_pool(game_pool, _exact_weights(weights)[0])
+
+        return _allocate_raw
+
+    threshold = config.early_conviction_days_threshold
+    multiplier = float(config.early_conviction_multiplier)
+    # multiplier = boost / base exactly, so exact boosted weights scale by boost and the rest by base.
+    boost, base = multiplier.as_integer_ratio()
+
+    def _allocate_boosted(
+        game_pool: int, stake_weights: Sequence[float], conviction_days: Sequence[int]
+    ) -> list[int]:
+        weights = _clamped(stake_weights)
+        if multiplier >= 0 and _is_float_column(weights):
+            allocations = _fast_allocate_game_pool(
+                game_pool,
+                [
+                    weight * multiplier if days >= threshold else weight
+                    for weight, days in zip(weights, conviction_days)
+                ],
+            )
+            if allocations is not None:
+                return allocations
+        return _allocate_game_pool(
+            game_pool,
+            [
+                weight * (boost if days >= threshold else base)
+                for weight, days in zip(_exact_weights(weights)[0], conviction_days)
+            ],
+        )
+
+    return _allocate_boosted
+
+
+def _rewards_by_game(
+    season: M4RewardSignal,
+    rewards: list[float],
+    game_offsets: tuple[int, ...],
+    first_game: int,
+) -> dict[str, dict[str, float]]:
+    """Nest one season's slice of a flat reward column by game and staker."""
+
+    reward_by_game: dict[str, dict[str, float]] = {}
+    for index, game in enumerate(season.games, first_game):
+        reward_by_game[game.game_id] = dict(
+            zip(game.staker_ids, rewards[game_offsets[index]:game_offsets[index + 1]])
+        )
+    return reward_by_game
+
+
+# Stages close over nothing but the frozen config, so equal configs can share one stage.
+@lru_cache(maxsize=32)
 def _make_staker_allocation_stage(config: M4RewardConfig):
+    allocate_game = _make_game_allocator(config)
+
     def _staker_allocation_stage(signal: Signal[M4RewardSignal], state: M4RewardState) -> StepResult:
-        reward_by_game: dict[str, dict[str, float]] = {}
-
-        for game in sorted(signal.payload.games, key=lambda item: item.game_id):
-            game_pool = state.latest_game_pool_by_game.get(game.game_id, 0.0)
-            stakers_sorted = sorted(game.stakers, key=lambda item: item.staker_id)
-
-            effective_weights: list[tuple[str, float]] = []
-            for staker in stakers_sorted:
-                multiplier = 1.0
-                if (
-                    config.enable_early_conviction_multiplier
-                    and staker.conviction_days >= config.early_conviction_days_threshold
-                ):
-                    multiplier = config.early_conviction_multiplier
-                effective_weights.append((staker.staker_id, max(staker.stake_weight, 0.0) * multiplier))
-
-            total_effective_weight = sum(weight for _, weight in effective_weights)
-            if total_effective_weight <= 0:
-                allocations = {staker_id: 0.0 for staker_id, _ in effective_weights}
-            else:
-                allocations = {
-                    staker_id: round(game_pool * (weight / total_effective_weight), 6)
-                    for staker_id, weight in effective_weights
-                }
-
-            reward_by_game[game.game_id] = allocations
-
-        total_distributed = round(
-            sum(sum(staker_alloc.values()) for staker_alloc in reward_by_game.values()),
-            6,
+        payload = signal.payload
+        pool_by_game = state.latest_game_pool_by_game
+        allocations = _allocate_rewards(
+            [_to_micro(pool_by_game.get(game_id, 0.0)) for game_id in payload.game_ids],
+            payload.stake_weights,
+            payload.conviction_days,
+            payload.game_offsets,
+            allocate_game,
         )
-        emission = Emission(
-            emission_id=f"{signal.signal_id}:staker",
-            emission_type="m4.rewards.staker.allocated",
-            caused_by=signal.signal_id,
-            timestamp=signal.timestamp,
-            payload={
-                "season_id": signal.payload.season_id,
-                "staker_reward_by_game": reward_by_game,
-                "total_distributed": total_distributed,
-                "config": {
-                    "enable_early_conviction_multiplier": config.enable_early_conviction_multiplier,
-                    "early_conviction_multiplier": config.early_conviction_multiplier,
-                    "early_conviction_days_threshold": config.early_conviction_days_threshold,
-                },
-            },
-            metadata={
-                "trace": {
-                    "stage": "staker_share_allocation",
-                    "caused_by": signal.signal_id,
-                    "formula": "game_pool * (effective_stake / sum(effective_stake))",
-                }
-            },
+        reward_by_game = _rewards_by_game(
+            payload, [item / _MICRO for item in allocations], payload.game_offsets, 0
         )
 
-        def updater(_: M4RewardState) -> M4RewardState:
-            return M4RewardState(
-                seasons_processed=state.seasons_processed + 1,
-                latest_season_id=state.latest_season_id,
-                latest_attention_share_by_game=dict(state.latest_attention_share_by_game),
-                latest_game_pool_by_game=dict(state.latest_game_pool_by_game),
-                latest_staker_rewards_by_game=reward_by_game,
-                total_distributed=state.total_distributed + total_distributed,
-            )
+        total_distributed = sum(allocations) / _MICRO
+        emission = _staker_emission(
+            signal,
+            signal.signal_id + _STAKER_SUFFIX,
+            payload.season_id,
+            reward_by_game,
+            total_distributed,
+            config,
+        )
+
+        def updater(current: M4RewardState) -> M4RewardState:
+            current.seasons_processed += 1
+            current.latest_staker_rewards_by_game = reward_by_game
+            current.total_distributed += total_distributed
+            return current
 
         return [emission], updater
 
@@ -228,6 +531,97 @@ def build_m4_reward_pipeline(config: M4RewardConfig | None = None) -> Pipeline:
     )
 
 
+def _make_batch_reward_step(config: M4RewardConfig):
+    allocate_game = _make_game_allocator(config)
+
+    def _batch_reward_step(signal: Signal[M4RewardBatchSignal], state: M4RewardState) -> StepResult:
+        batch = signal.payload
+        if not batch.seasons:
+            return [], None
+
+        # Attention and pool maths stay per season; staker allocation runs once over the batch.
+        plans = []
+        game_pools: list[int] = []
+        for season in batch.seasons:
+            shares, total_attention = _attention_shares(season.games)
+            total_reward_pool = _to_micro(season.total_reward_pool)
+            pool_by_game = _game_pools(total_reward_pool, shares)
+            game_pools += [_to_micro(pool_by_game.get(game_id, 0.0)) for game_id in season.game_ids]
+            plans.append((season, shares, total_attention, total_reward_pool, pool_by_game))
+
+        game_offsets = batch.game_offsets
+        allocations = _allocate_rewards(
+            game_pools,
+            batch.stake_weights,
+            batch.conviction_days,
+            game_offsets,
+            allocate_game,
+        )
+        rewards = [item / _MICRO for item in allocations]
+
+        emissions: list[Emission] = []
+        season_totals: list[float] = []
+        for index, plan in enumerate(plans):
+            season, shares, total_attention, total_reward_pool, pool_by_game = plan
+            first_game = batch.season_offsets[index]
+            last_game = batch.season_offsets[index + 1]
+            reward_by_game = _rewards_by_game(season, rewards, game_offsets, first_game)
+            total_distributed = (
+                sum(allocations[game_offsets[first_game]:game_offsets[last_game]]) / _MICRO
+            )
+            season_totals.append(total_distributed)
+            prefix = f"{signal.signal_id}:{season.season_id}"
+            emissions += [
+                _attention_emission(
+                    signal, prefix + _ATTENTION_SUFFIX, season.season_id, shares, total_attention
+                ),
+                _pool_emission(
+                    signal, prefix + _POOL_SUFFIX, season.season_id, total_reward_pool, pool_by_game
+                ),
+                _staker_emission(
+                    signal,
+                    prefix + _STAKER_SUFFIX,
+                    season.season_id,
+                    reward_by_game,
+                    total_distributed,
+                    config,
+                ),
+            ]
+
+        last_season, last_shares, _, _, last_pools = plans[-1]
+        last_rewards = emissions[-1].payload["staker_reward_by_game"]
+
+        def updater(current: M4RewardState) -> M4RewardState:
+            current.seasons_processed += len(plans)
+            current.latest_season_id = last_season.season_id
+            current.latest_attention_share_by_game = last_shares
+            current.latest_game_pool_by_game = last_pools
+            current.latest_staker_rewards_by_game = last_rewards
+            # Accumulate season by season so totals match sequential processing exactly.
+            for total in season_totals:
+                current.total_distributed += total
+            return current
+
+        return emissions, updater
+
+    return _batch_reward_step
+
+
+def build_m4_batch_reward_pipeline(config: M4RewardConfig | None = None) -> Pipeline:
+    """Create the M4 flow for multi-season batch signals.
+
+    Each season yields the same attention, pool and staker emissions as the
+    single-season pipeline, with ids ``"<signal_id>:<season_id>:<stage>"``;
+    staker allocation for every season runs in one pass over stacked columns.
+    """
+
+    effective_config = config or M4RewardConfig()
+    return Pipeline(
+        steps=[_make_batch_reward_step(effective_config)],
+        name="m4_attention_pool_staker_batch",
+    )
+
+
 def make_m4_signal(
     *,
     signal_id: str,
@@ -251,6 +645,23 @@ def make_m4_signal(
     )
 
 
+def make_m4_batch_signal(
+    *,
+    signal_id: str,
+    timestamp: datetime,
+    source: str,
+    seasons: Sequence[M4RewardSignal],
+) -> Signal[M4RewardBatchSignal]:
+    """Construct stable-ID multi-season M4 signals; seasons keep input order."""
+
+    return Signal(
+        signal_id=signal_id,
+        timestamp=timestamp,
+        source=source,
+        payload=M4RewardBatchSignal(seasons=tuple(seasons)),
+    )
+
+
 # Backward-compatible aliases retained for downstream imports.
 GameAttentionInput = GameRewardInput
 StakerStakeInput = StakerPosition
@@ -8,6 +8,7 @@ Pipelines are composable and can be nested.
 """
 
 from __future__ import annotations
+import copy
 from dataclasses import dataclass, field
 from typing import (
     Any, Optional, List, 
@@ -53,7 +54,10 @@ class Step(Protocol):
             Tuple of:
             - List of emissions (can be empty)
             - Optional state update function: (old_state) -> new_state
-              If None, state is unchanged.
+              If None, state is unchanged. Updaters may mutate the state
+              in place and return the same instance; the pipeline hands
+              them a per-signal working copy, committed only once every
+              step has succeeded.
         """
         ...
 
@@ -74,9 +78,13 @@ class Pipeline:
         ])
         
         emissions, final_state = pipeline.process(signal, state)
+    
+    Set ``stateful=False`` when no step returns a state updater; the engine
+    may then process batches of signals concurrently.
     """
     steps: List[Step]
     name: str = "unnamed"
+    stateful: bool = True
     
     def process(
         self, 
@@ -94,17 +102,25 @@ class Pipeline:
             Tuple of all emissions and updated state
         """
         all_emissions: List[Emission[Any]] = []
+        extend = all_emissions.extend
         current_state_value = state.value
+        updated = False
         
         for step in self.steps:
             emissions, state_updater = step(signal, current_state_value)
-            all_emissions.extend(emissions)
+            if emissions:
+                extend(emissions)
             
             if state_updater is not None:
+                if not updated:
+                    # Updaters may mutate in place, so they work on a copy; a later
+                    # failing step then leaves state.value (and its history) untouched.
+                    current_state_value = copy.copy(current_state_value)
+                    updated = True
                 current_state_value = state_updater(current_state_value)
         
-        # Apply final state update
-        if current_state_value is not state.value:
+        # Commit the working copy only after every step has succeeded
+        if updated or current_state_value is not state.value:
             state.update(current_state_value)
         
         return all_emissions, state
@@ -113,7 +129,8 @@ class Pipeline:
         """Add a step to the pipeline. Returns new pipeline."""
         return Pipeline(
             steps=self.steps + [step],
-            name=self.name
+            name=self.name,
+            stateful=self.stateful,
         )
     
     def branch(
@@ -175,6 +192,7 @@ class Pipeline:
         return FilteredPipeline(
             steps=self.steps,
             name=self.name,
+            stateful=self.stateful,
             filter_predicate=predicate
         )
     
@@ -182,7 +200,8 @@ class Pipeline:
         """Concatenate two pipelines."""
         return Pipeline(
             steps=self.steps + other.steps,
-            name=f"{self.name}+{other.name}"
+            name=f"{self.name}+{other.name}",
+            stateful=self.stateful or other.stateful,
         )
 
 
@@ -19,7 +19,7 @@ from .protocols import GameSignature
 # DOMAIN TYPES (Podcast-specific)
 # =============================================================================
 
-@dataclass(frozen=True)
+@dataclass(frozen=True, slots=True)
 class PodcastListen:
     """A podcast listening event."""
     episode_id: str
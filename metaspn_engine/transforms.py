@@ -6,11 +6,13 @@ All transforms are pure functions that follow the Step protocol.
 """
 
 from __future__ import annotations
+import copy
+import sys
 from dataclasses import dataclass, replace
 from datetime import datetime, timedelta
 from typing import (
     TypeVar, Any, Optional, List,
-    Callable
+    Callable, Sequence
 )
 from collections import deque
 
@@ -306,24 +308,45 @@ def time_window(
 # EMISSION TRANSFORMS
 # =============================================================================
 
+def _emission_id_suffix(
+    emission_suffix: Optional[str],
+    emission_id_factory: Optional[Callable[[Signal[Any], Any], str]],
+) -> Optional[str]:
+    """Resolve a literal id suffix to its interned ``":<suffix>"`` form."""
+    if emission_suffix is None:
+        return None
+    if emission_id_factory is not None:
+        raise ValueError("Pass either emission_suffix or emission_id_factory, not both")
+    return sys.intern(":" + emission_suffix)
+
+
 def emit(
     emission_type: str,
     payload_extractor: Callable[[Any, Any], Any],
     emission_id_factory: Optional[Callable[[Signal[Any], Any], str]] = None,
     timestamp_factory: Optional[Callable[[Signal[Any], Any], datetime]] = None,
+    emission_suffix: Optional[str] = None,
 ) -> Callable[[Signal[Any], Any], StepResult]:
     """
     Always emit an emission.
     
+    Pass ``emission_suffix`` instead of ``emission_id_factory`` for the common
+    ``"<signal_id>:<suffix>"`` deterministic id.
+    
     Example:
         pipeline = Pipeline([
             emit("signal_received", lambda payload, state: {"received": True}),
         ])
     """
+    emission_type = sys.intern(emission_type)
+    suffix = _emission_id_suffix(emission_suffix, emission_id_factory)
+    
     def step(signal: Signal[Any], state: Any) -> StepResult:
         payload = payload_extractor(signal.payload, state)
         emission_kwargs: dict[str, Any] = {}
-        if emission_id_factory is not None:
+        if suffix is not None:
+            emission_kwargs["emission_id"] = signal.signal_id + suffix
+        elif emission_id_factory is not None:
             emission_kwargs["emission_id"] = emission_id_factory(signal, state)
         if timestamp_factory is not None:
             emission_kwargs["timestamp"] = timestamp_factory(signal, state)
@@ -344,10 +367,13 @@ def emit_if(
     payload_extractor: Callable[[Any, Any], Any],
     emission_id_factory: Optional[Callable[[Signal[Any], Any], str]] = None,
     timestamp_factory: Optional[Callable[[Signal[Any], Any], datetime]] = None,
+    emission_suffix: Optional[str] = None,
 ) -> Callable[[Signal[Any], Any], StepResult]:
     """
     Conditionally emit an emission.
     
+    ``emission_suffix`` gives the same ``"<signal_id>:<suffix>"`` ids as ``emit``.
+    
     Example:
         pipeline = Pipeline([
             emit_if(
@@ -357,11 +383,16 @@ def emit_if(
             ),
         ])
     """
+    emission_type = sys.intern(emission_type)
+    suffix = _emission_id_suffix(emission_suffix, emission_id_factory)
+    
     def step(signal: Signal[Any], state: Any) -> StepResult:
         if condition(signal.payload, state):
             payload = payload_extractor(signal.payload, state)
             emission_kwargs: dict[str, Any] = {}
-            if emission_id_factory is not None:
+            if suffix is not None:
+                emission_kwargs["emission_id"] = signal.signal_id + suffix
+            elif emission_id_factory is not None:
                 emission_kwargs["emission_id"] = emission_id_factory(signal, state)
             if timestamp_factory is not None:
                 emission_kwargs["timestamp"] = timestamp_factory(signal, state)
@@ -377,6 +408,51 @@ def emit_if(
     return step
 
 
+def emit_many(
+    stages: Sequence[tuple[str, str, Callable[[Any, Any], Any]]],
+    timestamp_factory: Optional[Callable[[Signal[Any], Any], datetime]] = None,
+) -> Callable[[Signal[Any], Any], StepResult]:
+    """
+    Emit one emission per stage from a single step.
+    
+    Each stage is ``(suffix, emission_type, payload_extractor)``. Emission ids
+    are ``"<signal_id>:<suffix>"`` and emissions keep stage order, so a run of
+    ``emit`` steps can be fused into one step without changing its output.
+    
+    Example:
+        pipeline = Pipeline([
+            emit_many([
+                ("received", "signal_received", lambda payload, state: {"received": True}),
+                ("scored", "signal_scored", lambda payload, state: {"score": payload.score}),
+            ]),
+        ])
+    """
+    specs = tuple(
+        (sys.intern(":" + suffix), sys.intern(emission_type), payload_extractor)
+        for suffix, emission_type, payload_extractor in stages
+    )
+    
+    def step(signal: Signal[Any], state: Any) -> StepResult:
+        signal_id = signal.signal_id
+        payload = signal.payload
+        emission_kwargs: dict[str, Any] = {}
+        if timestamp_factory is not None:
+            emission_kwargs["timestamp"] = timestamp_factory(signal, state)
+        emissions = [
+            Emission(
+                payload=payload_extractor(payload, state),
+                caused_by=signal_id,
+                emission_type=emission_type,
+                emission_id=signal_id + suffix,
+                **emission_kwargs,
+            )
+            for suffix, emission_type, payload_extractor in specs
+        ]
+        return emissions, None
+    
+    return step
+
+
 def emit_on_change(
     state_field: str,
     emission_type: str,
@@ -464,6 +540,9 @@ def merge(*steps: Callable[[Signal[Any], Any], StepResult]) -> Callable[[Signal[
             emissions, updater = s(signal, current_state)
             all_emissions.extend(emissions)
             if updater is not None:
+                if current_state is state:
+                    # Keep in-place updaters off the caller's state value
+                    current_state = copy.copy(state)
                 current_state = updater(current_state)
         
         if current_state is not state:
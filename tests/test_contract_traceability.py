@@ -1,13 +1,16 @@
 """Contract-safety tests for IDs, serialization boundaries, and traceability."""
 
-from dataclasses import dataclass
+import weakref
+from dataclasses import asdict, dataclass, fields
 from datetime import datetime, timedelta
 
-from metaspn_engine import Engine, Pipeline, Signal
-from metaspn_engine.transforms import emit, emit_if
+from metaspn_engine import Emission, Engine, Pipeline, Signal
+from metaspn_engine.transforms import emit, emit_if, emit_many
 
+_ONE_SECOND = timedelta(seconds=1)
 
-@dataclass(frozen=True)
+
+@dataclass(frozen=True, slots=True)
 class ScoreEvent:
     user_id: str
     score: float
@@ -76,7 +79,7 @@ def test_batch_processing_preserves_traceability_and_emission_ordering() -> None
                 emission_type="second",
                 payload_extractor=lambda payload, state: {"score": payload.score},
                 emission_id_factory=lambda sig, state: f"{sig.signal_id}:second",
-                timestamp_factory=lambda sig, state: sig.timestamp + timedelta(seconds=1),
+                timestamp_factory=lambda sig, state: sig.timestamp + _ONE_SECOND,
             ),
         ],
         name="ordering_contract",
@@ -112,3 +115,174 @@ def test_batch_processing_preserves_traceability_and_emission_ordering() -> None
         datetime(2026, 2, 6, 12, 0, 5),
         datetime(2026, 2, 6, 12, 0, 6),
     ]
+
+
+def test_concurrent_batch_on_stateless_pipeline_preserves_order() -> None:
+    pipeline = Pipeline(
+        [
+            emit(
+                emission_type="first",
+                payload_extractor=lambda payload, state: {"user": payload.user_id},
+                emission_id_factory=lambda sig, state: f"{sig.signal_id}:first",
+            ),
+            emit(
+                emission_type="second",
+                payload_extractor=lambda payload, state: {"score": payload.score},
+                emission_id_factory=lambda sig, state: f"{sig.signal_id}:second",
+            ),
+        ],
+        name="stateless_contract",
+        stateful=False,
+    )
+    engine = Engine(pipeline=pipeline, initial_state={})
+    signals = [
+        Signal(
+            payload=ScoreEvent(user_id=f"u{index}", score=float(index)),
+            timestamp=datetime(2026, 2, 6, 12, 0, index),
+            source="ingestor.contract",
+            signal_id=f"sig_{index}",
+        )
+        for index in range(20)
+    ]
+
+    emissions = engine.process_batch(signals, workers=4)
+
+    assert [e.emission_id for e in emissions] == [
+        f"sig_{index}:{suffix}" for index in range(20) for suffix in ("first", "second")
+    ]
+    assert engine.stats.signals_processed == 20
+    assert engine.stats.emissions_produced == 40
+
+
+def test_signal_to_dict_returns_independent_copies() -> None:
+    signal = Signal(
+        payload=ScoreEvent(user_id="u1", score=5.0),
+        timestamp=datetime(2026, 2, 6, 10, 0, 0),
+        source="ingestor.contract",
+        signal_id="sig_cached",
+    )
+
+    first = signal.to_dict()
+
+    assert first["payload"] == {"user_id": "u1", "score": 5.0}
+    assert signal == Signal.from_dict(first, payload_factory=lambda payload: ScoreEvent(**payload))
+    assert signal.with_metadata(trace_id="tr_1").to_dict()["metadata"] == {"trace_id": "tr_1"}
+    assert "_cached_envelope" not in asdict(signal)
+    assert "_cached_envelope" not in {item.name for item in fields(signal)}
+
+    first["source"] = "mutated"
+
+    assert signal.to_dict()["source"] == "ingestor.contract"
+
+
+
+@dataclass
+class MutableScore:
+    user_id: str
+    scores: list
+
+
+def test_to_dict_serializes_payload_fresh_on_every_call() -> None:
+    timestamp = datetime(2026, 2, 6, 10, 0, 0)
+    signal = Signal(
+        payload=MutableScore(user_id="u1", scores=[1.0]),
+        timestamp=timestamp,
+        source="ingestor.contract",
+        signal_id="sig_fresh",
+    )
+    emission = Emission(
+        payload=MutableScore(user_id="u1", scores=[1.0]),
+        caused_by="sig_fresh",
+        emission_type="score",
+        emission_id="em_fresh",
+        timestamp=timestamp,
+    )
+
+    signal.to_dict()["payload"]["scores"].append(999.0)
+    emission.to_dict()["payload"]["scores"].append(999.0)
+    emission.payload.user_id = "u2"
+
+    assert signal.to_dict()["payload"] == {"user_id": "u1", "scores": [1.0]}
+    assert emission.to_dict()["payload"] == {"user_id": "u2", "scores": [1.0]}
+    assert emission.to_dict()["timestamp"] == "2026-02-06T10:00:00"
+
+
+def test_signals_and_emissions_support_weak_references() -> None:
+    signal = Signal(payload={"score": 1.0}, timestamp=datetime(2026, 2, 6, 10, 0, 0), source="test")
+    emission = Emission(payload={"score": 1.0}, caused_by=signal.signal_id, emission_type="score")
+
+    assert weakref.ref(signal)() is signal
+    assert weakref.ref(emission)() is emission
+
+def test_emit_many_fuses_stages_with_suffixed_ids_in_order() -> None:
+    timestamp = datetime(2026, 2, 6, 10, 0, 0)
+    pipeline = Pipeline(
+        [
+            emit_many(
+                [
+                    ("received", "score_received", lambda payload, state: {"user_id": payload.user_id}),
+                    ("scored", "score_scored", lambda payload, state: {"score": payload.score}),
+                ],
+                timestamp_factory=lambda sig, state: sig.timestamp,
+            )
+        ],
+        name="emit_many_contract",
+    )
+    engine = Engine(pipeline=pipeline, initial_state={})
+
+    emissions = engine.process(
+        Signal(
+            payload=ScoreEvent(user_id="u1", score=0.9),
+            timestamp=timestamp,
+            source="contract",
+            signal_id="sig_many",
+        )
+    )
+
+    assert [item.emission_id for item in emissions] == ["sig_many:received", "sig_many:scored"]
+    assert [item.emission_type for item in emissions] == ["score_received", "score_scored"]
+    assert {item.caused_by for item in emissions} == {"sig_many"}
+    assert {item.timestamp for item in emissions} == {timestamp}
+
+
+def test_emit_suffix_builds_deterministic_ids_without_factory() -> None:
+    pipeline = Pipeline(
+        [
+            emit("score_seen", lambda payload, state: {"score": payload.score}, emission_suffix="seen"),
+            emit_if(
+                condition=lambda payload, state: payload.score > 0.8,
+                emission_type="score_high",
+                payload_extractor=lambda payload, state: {"score": payload.score},
+                emission_suffix="score_high",
+            ),
+        ],
+        name="emit_suffix_contract",
+    )
+    engine = Engine(pipeline=pipeline, initial_state={})
+
+    emissions = engine.process(
+        Signal(
+            payload=ScoreEvent(user_id="u1", score=0.9),
+            timestamp=datetime(2026, 2, 6, 10, 0, 0),
+            source="contract",
+            signal_id="sig_suffix",
+        )
+    )
+
+    assert [item.emission_id for item in emissions] == ["sig_suffix:seen", "sig_suffix:score_high"]
+
+
+def test_plain_signal_subclass_serializes_with_slotted_base() -> None:
+    @dataclass(frozen=True)
+    class ScoreSignal(Signal[ScoreEvent]):
+        pass
+
+    signal = ScoreSignal(
+        payload=ScoreEvent(user_id="u2", score=1.5),
+        timestamp=datetime(2026, 2, 6, 10, 0, 0),
+        source="ingestor.contract",
+        signal_id="sig_sub",
+    )
+
+    assert signal.to_dict()["payload"] == {"user_id": "u2", "score": 1.5}
+    assert signal.to_dict() == signal.to_dict()
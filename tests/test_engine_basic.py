@@ -1,14 +1,16 @@
 """Minimal smoke tests for the MetaSPN Engine."""
 
+import asyncio
 from dataclasses import dataclass
 from datetime import datetime
 
+import pytest
 
-from metaspn_engine import Signal, Pipeline, Engine
+from metaspn_engine import Signal, Pipeline, Engine, AsyncEngine
 from metaspn_engine.transforms import accumulate, update_state, emit_if
 
 
-@dataclass(frozen=True)
+@dataclass(frozen=True, slots=True)
 class ScoreEvent:
     """Simple signal payload for tests."""
     user_id: str
@@ -90,3 +92,141 @@ def test_engine_emit_if_produces_emission():
     assert emissions[0].emission_type == "new_high_score"
     assert emissions[0].payload["score"] == 80.0
     assert emissions[0].caused_by == signal.signal_id
+
+
+def test_process_batch_settles_stats_and_history_per_batch():
+    """Batch processing keeps stats and bounded emission history consistent."""
+    pipeline = Pipeline([
+        accumulate("total_signals", lambda acc, _: (acc or 0) + 1),
+        emit_if(
+            condition=lambda payload, state: True,
+            emission_type="seen",
+            payload_extractor=lambda payload, state: {"user_id": payload.user_id},
+        ),
+    ], name="batch_stats")
+
+    engine = Engine(pipeline=pipeline, initial_state=GameState())
+    engine.config.max_history_size = 2
+
+    signals = [
+        Signal(
+            payload=ScoreEvent(user_id=f"user_{index}", score=float(index)),
+            timestamp=datetime.now(),
+            source="test",
+        )
+        for index in range(3)
+    ]
+
+    emissions = engine.process_batch(signals)
+
+    assert [item.payload["user_id"] for item in emissions] == ["user_0", "user_1", "user_2"]
+    assert engine.get_state().total_signals == 3
+    assert engine.stats.signals_processed == 3
+    assert engine.stats.emissions_produced == 3
+    assert engine.stats.state_updates == 3
+    assert [item.payload["user_id"] for item in engine.get_emission_history()] == [
+        "user_1",
+        "user_2",
+    ]
+
+
+def test_async_engine_streams_signals_in_order():
+    """AsyncEngine yields per-signal emissions in input order through a bounded queue."""
+    pipeline = Pipeline([
+        accumulate("total_signals", lambda acc, _: (acc or 0) + 1),
+        emit_if(
+            condition=lambda payload, state: True,
+            emission_type="seen",
+            payload_extractor=lambda payload, state: {"user_id": payload.user_id},
+        ),
+    ], name="async_stream")
+    engine = Engine(pipeline=pipeline, initial_state=GameState())
+
+    async def source():
+        for index in range(5):
+            yield Signal(
+                payload=ScoreEvent(user_id=f"user_{index}", score=float(index)),
+                timestamp=datetime.now(),
+                source="test",
+            )
+
+    async def run():
+        async_engine = AsyncEngine(engine, max_pending=2)
+        return [
+            (signal.payload.user_id, [item.payload["user_id"] for item in emissions])
+            async for signal, emissions in async_engine.process_stream(source())
+        ]
+
+    results = asyncio.run(run())
+
+    assert results == [(f"user_{index}", [f"user_{index}"]) for index in range(5)]
+    assert engine.get_state().total_signals == 5
+
+
+def test_async_engine_early_close_releases_producer():
+    """Closing the stream with a full queue cancels and finishes the producer task."""
+    engine = Engine(pipeline=Pipeline([], name="async_close"), initial_state=GameState())
+
+    def endless_source():
+        index = 0
+        while True:
+            yield Signal(
+                payload=ScoreEvent(user_id=f"user_{index}", score=float(index)),
+                timestamp=datetime.now(),
+                source="test",
+            )
+            index += 1
+
+    async def run():
+        stream = AsyncEngine(engine, max_pending=1).process_stream(endless_source())
+        first, _ = await stream.__anext__()
+        # Give the producer time to fill the queue and block on put
+        await asyncio.sleep(0)
+        await asyncio.sleep(0)
+        await asyncio.wait_for(stream.aclose(), timeout=1)
+        return first, asyncio.all_tasks() - {asyncio.current_task()}
+
+    first, pending = asyncio.run(run())
+
+    assert first.payload.user_id == "user_0"
+    assert pending == set()
+
+def test_process_batch_ignores_malformed_worker_env(monkeypatch):
+    """A bad METASPN_BATCH_WORKERS value falls back to serial processing."""
+    monkeypatch.setenv("METASPN_BATCH_WORKERS", "auto")
+    signals = [
+        Signal(payload=ScoreEvent(user_id="user_1", score=1.0), timestamp=datetime.now(), source="test"),
+    ]
+    stateful = Engine(
+        pipeline=Pipeline([accumulate("total_signals", lambda acc, _: (acc or 0) + 1)]),
+        initial_state=GameState(),
+    )
+    stateless = Engine(
+        pipeline=Pipeline(
+            [emit_if(lambda payload, state: True, "seen", lambda payload, state: {})],
+            stateful=False,
+        ),
+        initial_state=GameState(),
+    )
+
+    stateful.process_batch(signals)
+
+    assert stateful.get_state().total_signals == 1
+    assert len(stateless.process_batch(signals)) == 1
+
+
+def test_concurrent_batch_rejects_updaters_on_stateless_pipeline():
+    """A stateful=False pipeline whose step updates state fails loudly."""
+    pipeline = Pipeline([
+        accumulate("total_signals", lambda acc, _: (acc or 0) + 1),
+    ], name="mislabeled", stateful=False)
+    engine = Engine(pipeline=pipeline, initial_state=GameState())
+
+    signals = [
+        Signal(payload=ScoreEvent(user_id=f"user_{index}", score=1.0), timestamp=datetime.now(), source="test")
+        for index in range(2)
+    ]
+
+    with pytest.raises(RuntimeError, match="stateful=False"):
+        engine.process_batch(signals, workers=2)
+    assert engine.get_state().total_signals == 0
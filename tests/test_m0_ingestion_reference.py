@@ -92,3 +92,38 @@ def test_m0_batch_ordering_is_stable_for_multiple_signals() -> None:
         "sig_m0_3",
         "sig_m0_3",
     ]
+
+
+def test_m0_in_place_state_updates_bump_version_and_serialize() -> None:
+    engine = Engine(
+        pipeline=build_m0_ingestion_pipeline(),
+        initial_state=M0IngestionState(),
+    )
+    engine.state.enable_history()
+    initial_state = engine.get_state()
+    signal = make_m0_signal(
+        signal_id="sig_m0_4",
+        timestamp=datetime(2026, 2, 6, 13, 3, 0),
+        source="ops.m0.worker",
+        platform="x",
+        external_id="post_4",
+        actor_ref="user_4",
+        content_hash="hash_4",
+    )
+
+    engine.process(signal)
+
+    assert initial_state == M0IngestionState()
+    assert engine.state.get_history()[0]["version"] == 0
+    assert engine.state.get_history()[0]["value"] == {
+        "ingested_count": 0,
+        "resolved_count": 0,
+        "last_entity_ref": "",
+    }
+    assert engine.state.version == 1
+    assert engine.stats.state_updates == 1
+    assert engine.state.to_dict()["value"] == {
+        "ingested_count": 1,
+        "resolved_count": 1,
+        "last_entity_ref": "x:user_4",
+    }
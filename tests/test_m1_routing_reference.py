@@ -4,6 +4,7 @@ from datetime import datetime
 
 from metaspn_engine import Engine
 from metaspn_engine.m1_routing import (
+    M1ScorePayload,
     M1RoutingState,
     build_m1_routing_pipeline,
     make_m1_signal,
@@ -100,3 +101,28 @@ def test_m1_batch_flow_order_is_deterministic() -> None:
     ]
     assert emissions[2].payload["route"] == "standard_queue"
     assert emissions[5].payload["route"] == "priority_review"
+
+
+def test_m1_typed_payloads_serialize_like_dict_payloads() -> None:
+    signal = make_m1_signal(
+        signal_id="sig_m1_typed",
+        timestamp=datetime(2026, 2, 6, 14, 5, 0),
+        source="ops.m1.worker",
+        profile_id="p_typed",
+        profile_tier="gold",
+        quality_score=0.9,
+        intent_score=0.8,
+        channel="x",
+    )
+    plain = Engine(pipeline=build_m1_routing_pipeline(), initial_state=M1RoutingState())
+    typed = Engine(
+        pipeline=build_m1_routing_pipeline(typed_payloads=True),
+        initial_state=M1RoutingState(),
+    )
+
+    plain_emissions = plain.process(signal)
+    typed_emissions = typed.process(signal)
+
+    assert isinstance(typed_emissions[1].payload, M1ScorePayload)
+    assert typed_emissions[1].payload.route_hint == "priority_review"
+    assert [item.to_dict() for item in typed_emissions] == [item.to_dict() for item in plain_emissions]
@@ -4,6 +4,7 @@ from datetime import datetime
 
 from metaspn_engine import Engine
 from metaspn_engine.m2_recommendations import (
+    M2RecommendationSignal,
     M2RecommendationState,
     RecommendationCandidate,
     build_m2_recommendation_pipeline,
@@ -86,3 +87,43 @@ def test_m2_emissions_preserve_caused_by_and_batch_order() -> None:
     ]
     assert emissions[1].payload["recommended_candidate_id"] == "x1"
     assert emissions[3].payload["recommended_candidate_id"] == "y1"
+
+
+def test_m2_signal_derives_candidate_columns_in_input_order() -> None:
+    signal = make_m2_signal(
+        signal_id="sig_m2_cols",
+        timestamp=datetime(2026, 2, 6, 15, 2, 0),
+        source="ops.m2.worker",
+        audience_id="aud_3",
+        prompt="Draft recommendation",
+        candidates=(
+            RecommendationCandidate(candidate_id="y", title="Item Y", score=0.5, context_boost=0.25),
+            RecommendationCandidate(candidate_id="z", title="Item Z", score=0.79991),
+        ),
+    )
+
+    assert signal.payload.candidate_ids == ("y", "z")
+    assert signal.payload.rank_scores == (0.75, 0.8)
+
+
+def test_m2_payload_serializes_input_fields_only_and_round_trips() -> None:
+    signal = make_m2_signal(
+        signal_id="sig_m2_wire",
+        timestamp=datetime(2026, 2, 6, 15, 3, 0),
+        source="ops.m2.worker",
+        audience_id="aud_4",
+        prompt="Draft recommendation",
+        candidates=(RecommendationCandidate(candidate_id="q", title="Item Q", score=0.3),),
+    )
+
+    payload = signal.to_dict()["payload"]
+    restored = M2RecommendationSignal(
+        **{
+            **payload,
+            "candidates": tuple(RecommendationCandidate(**item) for item in payload["candidates"]),
+        }
+    )
+
+    assert set(payload) == {"audience_id", "prompt", "candidates"}
+    assert restored == signal.payload
+    assert restored.rank_scores == signal.payload.rank_scores
@@ -6,6 +6,7 @@ from metaspn_engine import Engine
 from metaspn_engine.m3_learning import (
     M3LearningState,
     build_m3_learning_pipeline,
+    build_m3_learning_pipeline_fused,
     make_m3_signal,
 )
 
@@ -102,3 +103,28 @@ def test_m3_batch_order_and_caused_by_chain_are_stable() -> None:
     ]
     assert emissions[3].payload["proposal"] == "increase_support"
     assert emissions[7].payload["proposal"] == "maintain"
+
+
+def test_m3_fused_pipeline_matches_staged_pipeline() -> None:
+    signals = [
+        make_m3_signal(
+            signal_id=f"sig_m3_fused_{index}",
+            timestamp=datetime(2026, 2, 6, 16, 3, index),
+            source="ops.m3.worker",
+            learner_id="l_4",
+            skill_id="skill_d",
+            attempt_id=f"attempt_fused_{index}",
+            expected_score=expected,
+            observed_score=observed,
+        )
+        for index, (expected, observed) in enumerate([(0.8, 0.62), (0.7, 0.69), (0.65, 0.66)])
+    ]
+    staged = Engine(pipeline=build_m3_learning_pipeline(), initial_state=M3LearningState())
+    fused = Engine(pipeline=build_m3_learning_pipeline_fused(), initial_state=M3LearningState())
+
+    staged_emissions = staged.process_batch(signals)
+    fused_emissions = fused.process_batch(signals)
+
+    assert [item.to_dict() for item in fused_emissions] == [item.to_dict() for item in staged_emissions]
+    assert fused.get_state() == staged.get_state()
+    assert fused.get_state().calibrations_emitted == 3
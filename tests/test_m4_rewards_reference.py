@@ -1,14 +1,22 @@
 """Golden tests for deterministic Season 1 reward pipeline outputs."""
 
+import json
+import random
 from datetime import datetime
+from fractions import Fraction
+
+import pytest
 
 from metaspn_engine import Engine
 from metaspn_engine.m4_rewards import (
     GameRewardInput,
     M4RewardConfig,
+    M4RewardSignal,
     M4RewardState,
     StakerPosition,
+    build_m4_batch_reward_pipeline,
     build_m4_reward_pipeline,
+    make_m4_batch_signal,
     make_m4_signal,
 )
 
@@ -113,4 +121,353 @@ def test_m4_reward_multiplier_toggle_and_reruns_are_deterministic() -> None:
         "g1": {"alice": 390.697674, "bob": 209.302326},
         "g2": {"alice": 95.238095, "carol": 304.761905},
     }
-    assert [item.to_dict() for item in boosted_a] == [item.to_dict() for item in boosted_b]
+    assert boosted_a == boosted_b
+    assert set(boosted_a) == set(boosted_b)
+
+
+def test_m4_signal_canonicalizes_game_and_staker_order() -> None:
+    signal = make_m4_signal(
+        signal_id="sig_m4_3",
+        timestamp=datetime(2026, 2, 7, 12, 0, 0),
+        source="ops.m4.worker",
+        season_id="season_1",
+        total_reward_pool=1000.0,
+        games=tuple(
+            GameRewardInput(
+                game_id=game.game_id,
+                attention_weight=game.attention_weight,
+                stakers=tuple(reversed(game.stakers)),
+            )
+            for game in reversed(_season_fixture_signal().payload.games)
+        ),
+    )
+
+    assert [game.game_id for game in signal.payload.games] == ["g1", "g2"]
+    assert [staker.staker_id for staker in signal.payload.games[0].stakers] == ["alice", "bob"]
+
+    engine = Engine(pipeline=build_m4_reward_pipeline(), initial_state=M4RewardState())
+    emissions = engine.process(signal)
+
+    assert emissions[2].payload["staker_reward_by_game"] == {
+        "g1": {"alice": 420.0, "bob": 180.0},
+        "g2": {"alice": 80.0, "carol": 320.0},
+    }
+
+
+def test_m4_trace_metadata_is_a_plain_mapping() -> None:
+    engine = Engine(
+        pipeline=build_m4_reward_pipeline(),
+        initial_state=M4RewardState(),
+    )
+
+    emissions = engine.process(_season_fixture_signal("sig_m4_trace"))
+    trace = emissions[1].metadata["trace"]
+    expected = {
+        "stage": "game_reward_pool_allocation",
+        "formula": "total_reward_pool * attention_share",
+        "caused_by": "sig_m4_trace",
+    }
+
+    assert trace == expected
+    assert trace.get("stage") == "game_reward_pool_allocation"
+    assert list(trace) == list(trace.keys()) == ["stage", "formula", "caused_by"]
+    assert json.loads(json.dumps(emissions[1].metadata)) == {"trace": expected}
+    assert emissions[1].to_dict()["metadata"]["trace"] == expected
+
+
+def test_m4_builds_with_equal_configs_share_stages_not_pipelines() -> None:
+    first = build_m4_reward_pipeline(M4RewardConfig(enable_early_conviction_multiplier=True))
+    second = build_m4_reward_pipeline(M4RewardConfig(enable_early_conviction_multiplier=True))
+
+    assert first is not second
+    assert first.steps == second.steps
+    assert first.steps is not second.steps
+
+
+def test_m4_batch_signal_matches_sequential_single_season_runs() -> None:
+    config = M4RewardConfig(enable_early_conviction_multiplier=True)
+    season_1 = _season_fixture_signal("sig_m4_s1")
+    season_2 = make_m4_signal(
+        signal_id="sig_m4_s2",
+        timestamp=datetime(2026, 2, 7, 12, 0, 0),
+        source="ops.m4.worker",
+        season_id="season_2",
+        total_reward_pool=500.0,
+        games=(
+            GameRewardInput(
+                game_id="g3",
+                attention_weight=1.0,
+                stakers=(StakerPosition(staker_id="dave", stake_weight=10.0, conviction_days=40),),
+            ),
+        ),
+    )
+    sequential = Engine(pipeline=build_m4_reward_pipeline(config), initial_state=M4RewardState())
+    expected = sequential.process_batch([season_1, season_2])
+
+    batched = Engine(pipeline=build_m4_batch_reward_pipeline(config), initial_state=M4RewardState())
+    emissions = batched.process(
+        make_m4_batch_signal(
+            signal_id="sig_m4_batch",
+            timestamp=datetime(2026, 2, 7, 12, 0, 0),
+            source="ops.m4.worker",
+            seasons=(season_1.payload, season_2.payload),
+        )
+    )
+
+    assert [item.emission_id for item in emissions] == [
+        "sig_m4_batch:season_1:attention",
+        "sig_m4_batch:season_1:pool",
+        "sig_m4_batch:season_1:staker",
+        "sig_m4_batch:season_2:attention",
+        "sig_m4_batch:season_2:pool",
+        "sig_m4_batch:season_2:staker",
+    ]
+    assert [item.payload for item in emissions] == [item.payload for item in expected]
+    assert batched.state.value == sequential.state.value
+
+
+def test_m4_failing_step_leaves_state_unchanged() -> None:
+    def fail(signal, state):
+        raise RuntimeError("downstream failure")
+
+    engine = Engine(
+        pipeline=build_m4_reward_pipeline().then(fail),
+        initial_state=M4RewardState(),
+    )
+
+    with pytest.raises(RuntimeError):
+        engine.process(_season_fixture_signal("sig_m4_fail"))
+
+    assert engine.state.version == 0
+    assert engine.get_state() == M4RewardState()
+
+
+def test_m4_batch_signal_rejects_duplicate_season_ids() -> None:
+    season = _season_fixture_signal("sig_m4_dup").payload
+
+    with pytest.raises(ValueError, match="Duplicate season_id"):
+        make_m4_batch_signal(
+            signal_id="sig_m4_dup_batch",
+            timestamp=datetime(2026, 2, 7, 12, 0, 0),
+            source="ops.m4.worker",
+            seasons=(season, season),
+        )
+
+
+def test_m4_payloads_serialize_input_fields_only_and_round_trip() -> None:
+    signal = _season_fixture_signal("sig_m4_wire")
+
+    payload = signal.to_dict()["payload"]
+    restored = M4RewardSignal(
+        season_id=payload["season_id"],
+        total_reward_pool=payload["total_reward_pool"],
+        games=tuple(
+            GameRewardInput(
+                **{**game, "stakers": tuple(StakerPosition(**item) for item in game["stakers"])}
+            )
+            for game in payload["games"]
+        ),
+    )
+    batch_payload = make_m4_batch_signal(
+        signal_id="sig_m4_wire_batch",
+        timestamp=datetime(2026, 2, 7, 12, 0, 0),
+        source="ops.m4.worker",
+        seasons=(signal.payload,),
+    ).to_dict()["payload"]
+
+    assert set(payload) == {"season_id", "total_reward_pool", "games"}
+    assert set(payload["games"][0]) == {"game_id", "attention_weight", "stakers"}
+    assert restored == signal.payload
+    assert restored.game_offsets == signal.payload.game_offsets
+    assert batch_payload == {"seasons": (payload,)}
+
+
+def _single_season_signal(signal_id: str, games: tuple[GameRewardInput, ...], total_reward_pool: float = 1000.0):
+    return make_m4_signal(
+        signal_id=signal_id,
+        timestamp=datetime(2026, 2, 7, 12, 0, 0),
+        source="ops.m4.worker",
+        season_id="season_1",
+        total_reward_pool=total_reward_pool,
+        games=games,
+    )
+
+
+def _half_up_6dp(value: Fraction) -> float:
+    scaled = value * 1_000_000
+    return int(scaled + Fraction(1, 2)) / 1_000_000
+
+
+def test_m4_rewards_use_unrounded_weights_beyond_six_decimals() -> None:
+    engine = Engine(pipeline=build_m4_reward_pipeline(), initial_state=M4RewardState())
+    attention = (0.3333333333, 0.6666666667)
+    stakes = ((0.1234567891, 0.8765432109), (2.0000004, 1.0000004))
+    signal = _single_season_signal(
+        "sig_m4_fine",
+        games=tuple(
+            GameRewardInput(
+                game_id=f"g{index}",
+                attention_weight=attention[index - 1],
+                stakers=tuple(
+                    StakerPosition(staker_id=staker_id, stake_weight=weight, conviction_days=1)
+                    for staker_id, weight in zip(("alice", "bob"), stakes[index - 1])
+                ),
+            )
+            for index in (1, 2)
+        ),
+    )
+
+    emissions = engine.process(signal)
+
+    attention_total = sum(Fraction(weight) for weight in attention)
+    expected_shares = {
+        f"g{index}": _half_up_6dp(Fraction(weight) / attention_total)
+        for index, weight in enumerate(attention, start=1)
+    }
+    expected_pools = {
+        game_id: _half_up_6dp(Fraction(1000) * Fraction(share)) for game_id, share in expected_shares.items()
+    }
+    expected_rewards = {}
+    for index, weights in enumerate(stakes, start=1):
+        game_id = f"g{index}"
+        stake_total = sum(Fraction(weight) for weight in weights)
+        expected_rewards[game_id] = {
+            staker_id: _half_up_6dp(Fraction(expected_pools[game_id]) * Fraction(weight) / stake_total)
+            for staker_id, weight in zip(("alice", "bob"), weights)
+        }
+
+    assert emissions[0].payload["attention_share_by_game"] == expected_shares
+    assert emissions[0].payload["total_attention"] == 1.0
+    assert emissions[1].payload["reward_pool_by_game"] == expected_pools
+    assert emissions[2].payload["staker_reward_by_game"] == expected_rewards
+
+
+def test_m4_sub_micro_stakes_still_receive_the_game_pool() -> None:
+    engine = Engine(pipeline=build_m4_reward_pipeline(), initial_state=M4RewardState())
+    signal = _single_season_signal(
+        "sig_m4_dust",
+        total_reward_pool=500.0,
+        games=(
+            GameRewardInput(
+                game_id="g1",
+                attention_weight=1.0,
+                stakers=(StakerPosition(staker_id="alice", stake_weight=3e-7, conviction_days=1),),
+            ),
+            GameRewardInput(
+                game_id="g2",
+                attention_weight=0.0,
+                stakers=(
+                    StakerPosition(staker_id="bob", stake_weight=4.4e-7, conviction_days=1),
+                    StakerPosition(staker_id="carol", stake_weight=5.4e-7, conviction_days=1),
+                ),
+            ),
+        ),
+    )
+
+    emissions = engine.process(signal)
+    stakers = emissions[2].payload
+
+    assert emissions[1].payload["reward_pool_by_game"] == {"g1": 500.0, "g2": 0.0}
+    assert stakers["staker_reward_by_game"]["g1"] == {"alice": 500.0}
+    assert stakers["total_distributed"] == 500.0
+
+    rebalanced = _single_season_signal(
+        "sig_m4_dust_2",
+        total_reward_pool=500.0,
+        games=(
+            GameRewardInput(
+                game_id="g2",
+                attention_weight=1.0,
+                stakers=(
+                    StakerPosition(staker_id="bob", stake_weight=4.4e-7, conviction_days=1),
+                    StakerPosition(staker_id="carol", stake_weight=5.4e-7, conviction_days=1),
+                ),
+            ),
+        ),
+    )
+
+    assert engine.process(rebalanced)[2].payload["staker_reward_by_game"] == {
+        "g2": {"bob": 224.489796, "carol": 275.510204},
+    }
+
+
+def test_m4_rational_stakes_split_by_exact_ratio() -> None:
+    engine = Engine(pipeline=build_m4_reward_pipeline(), initial_state=M4RewardState())
+    signal = _single_season_signal(
+        "sig_m4_rational",
+        total_reward_pool=100.0,
+        games=(
+            GameRewardInput(
+                game_id="g1",
+                attention_weight=1.0,
+                stakers=(
+                    StakerPosition(staker_id="a", stake_weight=Fraction(1, 3), conviction_days=1),
+                    StakerPosition(staker_id="b", stake_weight=Fraction(1, 4), conviction_days=1),
+                ),
+            ),
+        ),
+    )
+
+    rewards = engine.process(signal)[2].payload["staker_reward_by_game"]
+
+    assert rewards == {"g1": {"a": 57.142857, "b": 42.857143}}
+
+
+def test_m4_half_unit_ties_round_up() -> None:
+    engine = Engine(pipeline=build_m4_reward_pipeline(), initial_state=M4RewardState())
+    signal = _single_season_signal(
+        "sig_m4_tie",
+        total_reward_pool=0.000003,
+        games=(
+            GameRewardInput(
+                game_id="g1",
+                attention_weight=1.0,
+                stakers=(
+                    StakerPosition(staker_id="a", stake_weight=1.0, conviction_days=1),
+                    StakerPosition(staker_id="b", stake_weight=1.0, conviction_days=1),
+                ),
+            ),
+        ),
+    )
+
+    rewards = engine.process(signal)[2].payload["staker_reward_by_game"]
+
+    assert rewards == {"g1": {"a": 0.000002, "b": 0.000002}}
+
+
+@pytest.mark.parametrize("enable_multiplier", [False, True])
+def test_m4_random_float_stakes_match_exact_reference(enable_multiplier: bool) -> None:
+    config = M4RewardConfig(enable_early_conviction_multiplier=enable_multiplier)
+    engine = Engine(pipeline=build_m4_reward_pipeline(config), initial_state=M4RewardState())
+    rng = random.Random(21)
+    games = tuple(
+        GameRewardInput(
+            game_id=f"g{index}",
+            attention_weight=1.0,
+            stakers=tuple(
+                StakerPosition(
+                    staker_id=f"s{position:02d}",
+                    stake_weight=rng.choice((rng.random() * 100, float(rng.randint(0, 4)), 1e-300)),
+                    conviction_days=rng.randint(0, 60),
+                )
+                for position in range(12)
+            ),
+        )
+        for index in range(8)
+    )
+    signal = _single_season_signal("sig_m4_random", games=games, total_reward_pool=800.0)
+
+    rewards = engine.process(signal)[2].payload["staker_reward_by_game"]
+
+    multiplier = Fraction(config.early_conviction_multiplier) if enable_multiplier else Fraction(1)
+    for game in games:
+        weights = {
+            item.staker_id: Fraction(item.stake_weight)
+            * (multiplier if item.conviction_days >= config.early_conviction_days_threshold else 1)
+            for item in game.stakers
+        }
+        total = sum(weights.values())
+        assert rewards[game.game_id] == {
+            staker_id: _half_up_6dp(Fraction(100) * weight / total) if total else 0.0
+            for staker_id, weight in weights.items()
+        }